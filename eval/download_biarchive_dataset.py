@@ -4,53 +4,136 @@ Script to automatically download datasets from EMBL's BioImage Archive
 and extract metadata information.
 """
 
+import asyncio
+import json
+import operator
 import os
 import re
+import shutil
 import requests
 import yaml
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, NavigableString
 from urllib.parse import urljoin, urlparse
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used for the image sidecar instead
+    orjson = None
+
+try:
+    import aiohttp
+except ImportError:  # fall back to sequential requests downloads
+    aiohttp = None
+
+try:
+    import diskcache
+except ImportError:  # parsed pages are simply not cached
+    diskcache = None
+
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+# Upper bound on simultaneous image downloads (kept below the HTTP pool size).
+MAX_CONCURRENT_DOWNLOADS = 8
+# Retry policy for transient failures, shared by the requests and aiohttp paths.
+RETRY_TOTAL = 3
+RETRY_BACKOFF = 0.3
+RETRY_STATUSES = (500, 502, 503, 504)
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
+# How long a parsed dataset page stays in the on-disk cache (seconds).
+PAGE_CACHE_TTL = 24 * 60 * 60
+
+ACCESSION_RE = re.compile(r'/galleries/(S-[A-Z]+[0-9]+)')
+
+# Study-info labels, keyed by the metadata field their following <div> fills.
+STUDY_LABELS = {
+    'organism': re.compile(r'Organism', re.I),
+    'imaging_type': re.compile(r'Imaging type', re.I),
+    'license': re.compile(r'License', re.I),
+    'author': re.compile(r'By|Author', re.I),
+    'release_date': re.compile(r'Released', re.I),
+}
+# All study labels OR'd into one pattern, so each text node costs a single
+# C-level regex search; the per-label patterns only run on the few hits.
+STUDY_LABEL_RE = re.compile('|'.join(p.pattern for p in STUDY_LABELS.values()), re.I)
+
+# The per-image list is written next to the YAML summary as JSON Lines.
+IMAGES_SIDECAR_SUFFIX = '.images.jsonl'
+
+CONTENT_RE = re.compile(r'Content', re.I)
+IMAGES_COUNT_RE = re.compile(r'(\d+)\s+images?')
+FILES_COUNT_RE = re.compile(r'(\d+)\s+other\s+files?')
+# Image dimensions as shown in the viewable table, e.g. "(1, 4, 3, 2160, 2160)"
+DIMS_RE = re.compile(r'\(([^)]+)\)')
+# Pixel size embedded in an image URL, e.g. "...-512x512.png"
+URL_SIZE_RE = re.compile(r'(\d+)[x\-](\d+)')
+
+
+def _json_line(obj):
+    """Serialize *obj* as one newline-terminated JSON line (bytes)."""
+    if orjson is not None:
+        return orjson.dumps(obj) + b'\n'
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8') + b'\n'
+
 
 class BioImageArchiveDownloader:
     def __init__(self, base_data_folder="data"):
         self.base_data_folder = Path(base_data_folder)
         self.base_data_folder.mkdir(exist_ok=True)
         self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-        })
+        self.session.headers.update({'User-Agent': USER_AGENT})
+        # Keep connections alive across page/image fetches and retry
+        # transient server errors with backoff.
+        retry = Retry(total=RETRY_TOTAL, backoff_factor=RETRY_BACKOFF,
+                      status_forcelist=RETRY_STATUSES)
+        adapter = HTTPAdapter(pool_connections=50, pool_maxsize=50, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Parsed dataset pages, keyed by URL, revalidated via ETag/Last-Modified.
+        self._cache = (diskcache.Cache(str(self.base_data_folder / '.http_cache'))
+                       if diskcache is not None else None)
         
     def get_next_dataset_number(self):
         """Get the next available dataset number."""
-        existing_folders = [f for f in self.base_data_folder.iterdir() 
-                          if f.is_dir() and f.name.startswith('dataset_')]
-        if not existing_folders:
-            return "001"
-        
-        numbers = []
-        for folder in existing_folders:
-            match = re.match(r'dataset_(\d+)', folder.name)
-            if match:
-                numbers.append(int(match.group(1)))
+        prefix_len = len('dataset_')
+        with os.scandir(self.base_data_folder) as entries:
+            numbers = [int(entry.name[prefix_len:]) for entry in entries
+                       if entry.is_dir() and entry.name.startswith('dataset_')
+                       and entry.name[prefix_len:].isdigit()]
         
         next_num = max(numbers) + 1 if numbers else 1
         return f"{next_num:03d}"
     
     def extract_accession_from_url(self, url):
         """Extract dataset accession from URL."""
-        match = re.search(r'/galleries/(S-[A-Z]+[0-9]+)', url)
+        match = ACCESSION_RE.search(url)
         return match.group(1) if match else None
     
     def parse_dataset_page(self, url):
         """Parse the dataset page and extract metadata."""
         print(f"Fetching dataset page: {url}")
-        response = self.session.get(url)
+        cached = self._cache.get(url) if self._cache is not None else None
+        response = self.session.get(url, headers=cached[0] if cached else None)
+        if cached and response.status_code == 304:
+            print("Dataset page not modified, using cached metadata")
+            metadata = cached[1]
+            metadata['download_timestamp'] = time.strftime('%Y-%m-%d %H:%M:%S')
+            return metadata
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.text, 'html.parser')
+        # The C-backed lxml parser; ``response.text`` keeps requests' charset
+        # handling (Content-Type header, then detection).
+        soup = BeautifulSoup(response.text, 'lxml')
         
         # Extract basic study information
         metadata = {
@@ -74,55 +157,39 @@ class BioImageArchiveDownloader:
         # Extract study information section
         study_info = {}
         
-        # Look for organism
-        organism_elem = soup.find(string=re.compile(r'Organism', re.I))
-        if organism_elem:
-            organism_value = organism_elem.find_next('div')
-            if organism_value:
-                study_info['organism'] = organism_value.get_text(strip=True)
-        
-        # Look for imaging type
-        imaging_elem = soup.find(string=re.compile(r'Imaging type', re.I))
-        if imaging_elem:
-            imaging_value = imaging_elem.find_next('div')
-            if imaging_value:
-                study_info['imaging_type'] = imaging_value.get_text(strip=True)
-        
-        # Look for license
-        license_elem = soup.find(string=re.compile(r'License', re.I))
-        if license_elem:
-            license_value = license_elem.find_next('div')
-            if license_value:
-                study_info['license'] = license_value.get_text(strip=True)
-        
-        # Look for author
-        author_elem = soup.find(string=re.compile(r'By|Author', re.I))
-        if author_elem:
-            author_value = author_elem.find_next('div')
-            if author_value:
-                study_info['author'] = author_value.get_text(strip=True)
-        
-        # Look for release date
-        release_elem = soup.find(string=re.compile(r'Released', re.I))
-        if release_elem:
-            release_value = release_elem.find_next('div')
-            if release_value:
-                study_info['release_date'] = release_value.get_text(strip=True)
+        # Locate every label in a single walk over the text nodes instead of
+        # one full-tree regex search per label.
+        label_nodes = {}
+        for node in soup.descendants:
+            if not isinstance(node, NavigableString) or not STUDY_LABEL_RE.search(node):
+                continue
+            for key, pattern in STUDY_LABELS.items():
+                if key not in label_nodes and pattern.search(node):
+                    label_nodes[key] = node
+            if len(label_nodes) == len(STUDY_LABELS):
+                break
+        
+        for key in STUDY_LABELS:
+            label_elem = label_nodes.get(key)
+            if label_elem:
+                value_elem = label_elem.find_next('div')
+                if value_elem:
+                    study_info[key] = value_elem.get_text(strip=True)
         
         metadata['study_info'] = study_info
         
         # Extract content information
         content_info = {}
-        content_elem = soup.find(string=re.compile(r'Content', re.I))
+        content_elem = soup.find(string=CONTENT_RE)
         if content_elem:
             content_text = content_elem.get_text(strip=True)
             # Extract number of images
-            images_match = re.search(r'(\d+)\s+images?', content_text)
+            images_match = IMAGES_COUNT_RE.search(content_text)
             if images_match:
                 content_info['total_images'] = int(images_match.group(1))
             
             # Extract number of other files
-            files_match = re.search(r'(\d+)\s+other\s+files?', content_text)
+            files_match = FILES_COUNT_RE.search(content_text)
             if files_match:
                 content_info['other_files'] = int(files_match.group(1))
         
@@ -131,6 +198,8 @@ class BioImageArchiveDownloader:
         # Extract image information from both tables
         images = []
         tables = soup.find_all('table')
+        parse_row = self._parse_image_row
+        append_image = images.append
         
         # First, parse the "Viewable images" table (has preview images)
         if len(tables) > 0:
@@ -138,11 +207,11 @@ class BioImageArchiveDownloader:
             print("Parsing viewable images table (with previews)...")
             rows = viewable_table.find_all('tr')[1:]  # Skip header row
             for row in rows:
-                cells = row.find_all('td')
+                cells = [c for c in row.children if getattr(c, 'name', None) == 'td']
                 if len(cells) >= 6:  # Image ID, Preview, Filename, Dimensions, Download Size, Actions
-                    image_info = self._parse_image_row(cells, url, has_preview=True)
+                    image_info = parse_row(cells, url, has_preview=True)
                     if image_info:
-                        images.append(image_info)
+                        append_image(image_info)
         
         # Then, try to parse the "All images" table (complete list)
         if len(tables) > 1:
@@ -155,29 +224,43 @@ class BioImageArchiveDownloader:
                 print("All images table appears to be empty (likely loaded dynamically)")
                 print("Only images with previews are available for download")
             else:
+                # Index the ids we already have so duplicates are O(1) to spot
+                seen_ids = {img['image_id'] for img in images if 'image_id' in img}
                 for row in rows:
-                    cells = row.find_all('td')
+                    cells = [c for c in row.children if getattr(c, 'name', None) == 'td']
                     if len(cells) >= 4:  # Image ID, Filename, Download Size, Actions
                         image_id_text = cells[0].get_text(strip=True)
                         
                         # Check if we already have this image from the viewable table
-                        existing_image = next((img for img in images if img.get('image_id') == image_id_text), None)
-                        
-                        if not existing_image:
-                            # Parse this row and add it
-                            image_info = self._parse_image_row(cells, url, has_preview=False)
-                            if image_info:
-                                images.append(image_info)
-                        else:
+                        if image_id_text in seen_ids:
                             # We already have this image with preview, skip
                             print(f"Image {image_id_text} already exists with preview, skipping from all images table")
+                            continue
+                        
+                        # Parse this row and add it
+                        image_info = parse_row(cells, url, has_preview=False)
+                        if image_info:
+                            append_image(image_info)
+                            if 'image_id' in image_info:
+                                seen_ids.add(image_info['image_id'])
         
         # Sort images by image_id for consistent ordering
-        images.sort(key=lambda x: int(x.get('image_id', '0').replace('IM', '')) if x.get('image_id', '').replace('IM', '').isdigit() else 999)
+        images.sort(key=operator.itemgetter('_sort_key'))
+        for image_info in images:
+            del image_info['_sort_key']
         
         metadata['images'] = images
         print(f"Found {len(images)} images in the dataset")
         
+        if self._cache is not None:
+            validators = {}
+            if 'ETag' in response.headers:
+                validators['If-None-Match'] = response.headers['ETag']
+            if 'Last-Modified' in response.headers:
+                validators['If-Modified-Since'] = response.headers['Last-Modified']
+            if validators:
+                self._cache.set(url, (validators, metadata), expire=PAGE_CACHE_TTL)
+        
         return metadata
     
     def _parse_image_row(self, cells, url, has_preview=False):
@@ -201,7 +284,7 @@ class BioImageArchiveDownloader:
             dimensions_text = cells[3].get_text(strip=True)
             if dimensions_text and dimensions_text != 'Unavailable':
                 # Parse dimensions like (1, 4, 3, 2160, 2160)
-                dims_match = re.search(r'\(([^)]+)\)', dimensions_text)
+                dims_match = DIMS_RE.search(dimensions_text)
                 if dims_match:
                     dims = [int(x.strip()) for x in dims_match.group(1).split(',')]
                     image_info['dimensions'] = {
@@ -236,7 +319,14 @@ class BioImageArchiveDownloader:
                     else:
                         image_info['preview_url'] = urljoin(url, preview_src)
         
-        return image_info if image_info else None
+        if not image_info:
+            return None
+        
+        # Numeric sort key computed once per row (IM12 -> 12, unknown -> 999);
+        # parse_dataset_page strips it again after sorting.
+        image_number = image_info.get('image_id', '').replace('IM', '')
+        image_info['_sort_key'] = int(image_number) if image_number.isdigit() else 999
+        return image_info
     
     def _find_large_preview_image(self, soup, base_url):
         """Find the larger representative preview image on the page."""
@@ -327,8 +417,7 @@ class BioImageArchiveDownloader:
                 full_url = urljoin(base_url, src)
             
             # Look for images with dimension patterns like 512x512, 1024x1024, etc.
-            import re
-            dim_match = re.search(r'(\d+)[x\-](\d+)', src)
+            dim_match = URL_SIZE_RE.search(src)
             if dim_match:
                 width, height = int(dim_match.group(1)), int(dim_match.group(2))
                 if width >= 256 and height >= 256:  # At least 256x256
@@ -357,8 +446,7 @@ class BioImageArchiveDownloader:
                 
                 # Try to determine the size/quality of the preview
                 # Look for dimension indicators in the URL
-                import re
-                dim_match = re.search(r'(\d+)[x\-](\d+)', preview_url)
+                dim_match = URL_SIZE_RE.search(preview_url)
                 if dim_match:
                     width, height = int(dim_match.group(1)), int(dim_match.group(2))
                     area = width * height
@@ -384,14 +472,120 @@ class BioImageArchiveDownloader:
         response = self.session.get(image_url, stream=True)
         response.raise_for_status()
         
+        # Copy straight from the urllib3 stream in large blocks rather than
+        # looping over small iter_content() chunks in Python.
+        response.raw.decode_content = True
         with open(local_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                f.write(chunk)
+            shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+        
+        print(f"Downloaded: {local_path}")
+        return local_path
+    
+    async def _download_image_async(self, session, semaphore, image_url, local_path):
+        """Download a single image on an aiohttp session, bounded by *semaphore*.
+        
+        Transient server and connection errors are retried with the same
+        backoff policy as the requests session.
+        """
+        print(f"Downloading: {image_url}")
+        for attempt in range(RETRY_TOTAL + 1):
+            last_try = attempt == RETRY_TOTAL
+            try:
+                async with semaphore, session.get(image_url) as response:
+                    if response.status not in RETRY_STATUSES or last_try:
+                        response.raise_for_status()
+                        with open(local_path, 'wb') as f:
+                            async for chunk in response.content.iter_chunked(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                        break
+            except (aiohttp.ClientConnectionError, aiohttp.ClientPayloadError,
+                    asyncio.TimeoutError):
+                # never leave a truncated image behind, whether we retry or not
+                Path(local_path).unlink(missing_ok=True)
+                if last_try:
+                    raise
+            except BaseException:
+                Path(local_path).unlink(missing_ok=True)
+                raise
+            # back off outside the semaphore so other downloads keep going
+            await asyncio.sleep(RETRY_BACKOFF * 2 ** attempt)
         
         print(f"Downloaded: {local_path}")
         return local_path
     
-    def download_dataset(self, dataset_url, image_id=None, download_files=True):
+    async def _download_images_async(self, jobs, max_concurrency=MAX_CONCURRENT_DOWNLOADS):
+        """Download all *jobs* concurrently; exceptions are returned, not raised."""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        connector = aiohttp.TCPConnector(limit_per_host=16)
+        # no total deadline (large images legitimately take minutes); only
+        # stalled connects and reads count as failures
+        timeout = aiohttp.ClientTimeout(total=None, sock_connect=30, sock_read=60)
+        # only the identifying header; requests' transport defaults
+        # (Accept-Encoding, Connection) are aiohttp's own business
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout,
+                                         headers={'User-Agent': USER_AGENT}) as session:
+            return await asyncio.gather(
+                *(self._download_image_async(session, semaphore, url, path)
+                  for url, path in jobs),
+                return_exceptions=True,
+            )
+    
+    def _download_images(self, jobs):
+        """Download ``(url, local_path)`` jobs, returning one error (or None) per job."""
+        if not jobs:
+            return []
+        
+        if aiohttp is not None:
+            results = asyncio.run(self._download_images_async(jobs))
+            return [r if isinstance(r, Exception) else None for r in results]
+        
+        # No aiohttp: the pooled requests session is safe to share across threads
+        def fetch(job):
+            try:
+                self.download_image(*job)
+                return None
+            except Exception as e:
+                return e
+        
+        with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_DOWNLOADS) as executor:
+            return list(executor.map(fetch, jobs))
+    
+    def save_metadata(self, metadata, metadata_file, monolithic_yaml=False):
+        """Write dataset metadata to *metadata_file*.
+        
+        The (potentially large) ``images`` list goes to a JSON Lines sidecar
+        next to the YAML summary, one image per line. Pass
+        ``monolithic_yaml=True`` to export everything as a single YAML file.
+        """
+        metadata_file = Path(metadata_file)
+        summary = metadata
+        if not monolithic_yaml:
+            images = metadata.get('images', [])
+            images_file = metadata_file.with_suffix(IMAGES_SIDECAR_SUFFIX)
+            with open(images_file, 'wb') as f:
+                f.writelines(_json_line(img) for img in images)
+            summary = {k: v for k, v in metadata.items() if k != 'images'}
+            summary['images_file'] = images_file.name
+            summary['image_count'] = len(images)
+        
+        with open(metadata_file, 'w', encoding='utf-8') as f:
+            yaml.dump(summary, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
+    
+    def load_metadata(self, metadata_file):
+        """Load metadata written by ``save_metadata``, re-attaching the image list."""
+        metadata_file = Path(metadata_file)
+        with open(metadata_file, 'r', encoding='utf-8') as f:
+            metadata = yaml.load(f, Loader=SafeLoader)
+        
+        images_file = metadata.get('images_file')
+        if images_file:
+            loads = orjson.loads if orjson is not None else json.loads
+            with open(metadata_file.parent / images_file, 'rb') as f:
+                metadata['images'] = [loads(line) for line in f if line.strip()]
+        return metadata
+    
+    def download_dataset(self, dataset_url, image_id=None, download_files=True,
+                         monolithic_yaml=False):
         """Download a complete dataset from BioImage Archive."""
         # Get next dataset number
         dataset_num = self.get_next_dataset_number()
@@ -411,8 +605,6 @@ class BioImageArchiveDownloader:
         metadata['dataset_number'] = dataset_num
         metadata['download_files'] = download_files
         
-        # Download images (if requested)
-        downloaded_files = []
         images_to_download = metadata['images']
         
         # Filter by image_id if provided
@@ -430,6 +622,28 @@ class BioImageArchiveDownloader:
             images_to_download = images_to_download[:1]
             print("No Image ID specified, downloading first image")
         
+        # Fetch the preview in the background while the image files download
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            preview_future = executor.submit(
+                self._download_preview, metadata, images_to_download, dataset_folder)
+            downloaded_files = self._download_files(
+                images_to_download, dataset_folder, download_files)
+            preview_files = preview_future.result()
+        
+        metadata['downloaded_files'] = downloaded_files
+        metadata['preview_files'] = preview_files
+        
+        # Save metadata
+        metadata_file = dataset_folder / f"dataset_{dataset_num}.yaml"
+        self.save_metadata(metadata, metadata_file, monolithic_yaml=monolithic_yaml)
+        
+        print(f"Metadata saved to: {metadata_file}")
+        print(f"Dataset {dataset_num} completed successfully!")
+        
+        return dataset_folder, metadata_file
+    
+    def _download_preview(self, metadata, images_to_download, dataset_folder):
+        """Download the dataset preview image and return the preview file records."""
         # Download preview images - prioritize large representative, fall back to best individual preview
         preview_files = []
         preview_downloaded = False
@@ -479,25 +693,32 @@ class BioImageArchiveDownloader:
         if not preview_downloaded:
             print("No suitable preview image found, skipping preview download")
         
+        return preview_files
+    
+    def _download_files(self, images_to_download, dataset_folder, download_files):
+        """Download the selected image files and return the downloaded file records."""
+        downloaded_files = []
         if download_files:
             print("Downloading image files...")
-            for i, image_info in enumerate(images_to_download):
+            jobs = []
+            for image_info in images_to_download:
                 if 'download_url' in image_info:
-                    filename = image_info['filename']
-                    local_path = dataset_folder / filename
+                    local_path = dataset_folder / image_info['filename']
                     
                     # Create directory structure if needed
                     local_path.parent.mkdir(parents=True, exist_ok=True)
-                    
-                    try:
-                        self.download_image(image_info['download_url'], local_path)
-                        downloaded_files.append({
-                            'filename': filename,
-                            'local_path': str(local_path),
-                            'image_info': image_info
-                        })
-                    except Exception as e:
-                        print(f"Failed to download {filename}: {e}")
+                    jobs.append((image_info['download_url'], local_path, image_info))
+            
+            results = self._download_images([(url, path) for url, path, _ in jobs])
+            for (url, local_path, image_info), error in zip(jobs, results):
+                if error is not None:
+                    print(f"Failed to download {image_info['filename']}: {error}")
+                    continue
+                downloaded_files.append({
+                    'filename': image_info['filename'],
+                    'local_path': str(local_path),
+                    'image_info': image_info
+                })
         else:
             print("Skipping file downloads - metadata only mode")
             # Still track which files would be downloaded
@@ -509,18 +730,7 @@ class BioImageArchiveDownloader:
                         'image_info': image_info
                     })
         
-        metadata['downloaded_files'] = downloaded_files
-        metadata['preview_files'] = preview_files
-        
-        # Save metadata
-        metadata_file = dataset_folder / f"dataset_{dataset_num}.yaml"
-        with open(metadata_file, 'w', encoding='utf-8') as f:
-            yaml.dump(metadata, f, default_flow_style=False, allow_unicode=True)
-        
-        print(f"Metadata saved to: {metadata_file}")
-        print(f"Dataset {dataset_num} completed successfully!")
-        
-        return dataset_folder, metadata_file
+        return downloaded_files
     
     def list_available_images(self, dataset_url):
         """List all available image IDs for a dataset."""
@@ -552,49 +762,48 @@ class BioImageArchiveDownloader:
         # Track renamed files
         anonymized_files = []
         
-        # Process downloaded files - rename them within the same dataset folder
-        for item in dataset_folder.rglob('*'):
-            if item.is_file() and item.name != f"dataset_{dataset_num}.yaml":
-                # Get relative path from original dataset folder
-                rel_path = item.relative_to(dataset_folder)
+        # Single bottom-up walk: rename files into the dataset root, then drop
+        # each subfolder once its contents have been handled.
+        metadata_names = {f"dataset_{dataset_num}.yaml",
+                          f"dataset_{dataset_num}{IMAGES_SIDECAR_SUFFIX}"}
+        for root, dirs, files in os.walk(dataset_folder, topdown=False):
+            for name in files:
+                if name in metadata_names:
+                    continue
                 
-                # Create anonymized filename
-                if rel_path.parent == Path('.'):
-                    # File is in root of dataset folder
-                    anonymized_filename = f"dataset_{dataset_num}{item.suffix}"
-                else:
-                    # File is in subfolder - flatten to root with dataset number
-                    anonymized_filename = f"dataset_{dataset_num}{item.suffix}"
+                # Get relative path from original dataset folder
+                src = os.path.join(root, name)
+                rel_path = os.path.relpath(src, dataset_folder)
                 
-                # Create new path within the same dataset folder
+                # Flatten to the root of the dataset folder with the dataset number
+                anonymized_filename = f"dataset_{dataset_num}{os.path.splitext(name)[1]}"
                 anonymized_path = dataset_folder / anonymized_filename
                 
                 # Move (rename) the file within the same folder
-                item.rename(anonymized_path)
+                os.rename(src, anonymized_path)
                 
                 anonymized_files.append({
-                    'original_path': str(rel_path),
+                    'original_path': rel_path,
                     'anonymized_path': str(anonymized_path.relative_to(self.base_data_folder)),
                     'anonymized_filename': anonymized_filename
                 })
                 
                 print(f"Renamed: {rel_path} -> {anonymized_filename}")
-        
-        # Remove empty subfolders after renaming files
-        for item in dataset_folder.rglob('*'):
-            if item.is_dir() and item != dataset_folder:
-                # Check if directory is empty
+            
+            # Remove subfolders that are now empty
+            for name in dirs:
+                sub = os.path.join(root, name)
                 try:
-                    if not any(item.iterdir()):  # Directory is empty
-                        item.rmdir()
-                        print(f"Removed empty folder: {item.relative_to(dataset_folder)}")
+                    os.rmdir(sub)
+                    print(f"Removed empty folder: {os.path.relpath(sub, dataset_folder)}")
                 except OSError:
                     # Directory not empty or other error, skip
                     pass
         
-        # Update metadata with anonymization info
+        # Update metadata with anonymization info (only the YAML summary
+        # changes; the image sidecar, if any, is left as-is)
         with open(metadata_file, 'r', encoding='utf-8') as f:
-            metadata = yaml.safe_load(f)
+            metadata = yaml.load(f, Loader=SafeLoader)
         
         metadata['anonymized'] = True
         metadata['anonymized_files'] = anonymized_files
@@ -603,7 +812,7 @@ class BioImageArchiveDownloader:
         
         # Save updated metadata
         with open(metadata_file, 'w', encoding='utf-8') as f:
-            yaml.dump(metadata, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(metadata, f, Dumper=SafeDumper, default_flow_style=False, allow_unicode=True)
         
         print(f"Anonymized dataset: {dataset_folder}")
         print(f"Anonymized metadata: {metadata_file}")
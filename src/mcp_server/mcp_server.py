@@ -15,26 +15,53 @@ Usage:
 from __future__ import annotations
 
 import argparse
+import atexit
+import functools
+import json
 import logging
+import logging.handlers
 import os
-from pathlib import Path
-import argparse, json, logging, os
-from typing import Any
-
-from mcp.server.fastmcp import FastMCP, Image
-
+import queue
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib encoder
+    orjson = None
 
 # Add the current directory to Python path to ensure imports work
 current_dir = Path(__file__).parent
 if str(current_dir) not in sys.path:
     sys.path.insert(0, str(current_dir))
 
-from napari_manager import NapariManager
+# FastMCP and the manager (numpy) are imported where they are used, so that
+# e.g. ``--help`` doesn't pay for them
+if TYPE_CHECKING:
+    from mcp.server.fastmcp import FastMCP
+    from napari_manager import NapariManager
 
 _LOGGER = logging.getLogger("bioimage_agent_socket")
 
+# tool replies are compact JSON; main() switches on indenting at --loglevel DEBUG
+_PRETTY_JSON = False
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> str:
+        """Encode *obj* as JSON for a tool reply."""
+        option = _ORJSON_OPTS | orjson.OPT_INDENT_2 if _PRETTY_JSON else _ORJSON_OPTS
+        return orjson.dumps(obj, option=option).decode()
+else:
+    def _dumps(obj: Any) -> str:
+        """Encode *obj* as JSON for a tool reply."""
+        if _PRETTY_JSON:
+            return json.dumps(obj, indent=2)
+        return json.dumps(obj, separators=(",", ":"))
+
+
 def _format_response(success: bool, message: Any, default_success: str = "✅ Operation completed successfully") -> str:
     """Format response from manager commands to ensure string output.
     
@@ -54,31 +81,106 @@ def _format_response(success: bool, message: Any, default_success: str = "✅ Op
         return f"❌ {message}"
 
 
-###########################################################################
-# CLI parsing / logging
-###########################################################################
+def _format_json(success: bool, message: Any) -> str:
+    """Format a structured manager reply as JSON.
+    
+    Args:
+        success: Whether the operation succeeded
+        message: The payload (or error message) returned from the manager
+        
+    Returns:
+        str: JSON text on success, otherwise the error message prefixed with ❌
+    """
+    return _dumps(message) if success else f"❌ {message}"
 
-def _parse_args() -> argparse.Namespace:
-    """Parse command line arguments for the napari MCP server.
+
+def _format_result(success: bool, message: Any) -> str:
+    """Format a reply whose shape isn't known in advance (generic command calls).
     
+    Args:
+        success: Whether the operation succeeded
+        message: The payload (or error message) returned from the manager
+        
     Returns:
-        argparse.Namespace: Parsed command line arguments containing:
-            - host: Napari socket host (default: "127.0.0.1")
-            - port: Napari socket port (default: 64908)
-            - timeout: TCP timeout in seconds (default: 5.0)
-            - loglevel: Console log level (default: "INFO")
+        str: JSON for dicts/lists, a size summary for binary payloads,
+             otherwise the plain message (errors prefixed with ❌)
+    """
+    if success and isinstance(message, (dict, list)):
+        return _format_json(success, message)
+    if success and isinstance(message, (bytes, bytearray)):
+        return f"✅ Received {len(message)} bytes of binary data"
+    return _format_response(success, message)
+
+
+def _result_value(success: bool, message: Any) -> Any:
+    """Return a reply as a plain JSON value, for embedding in a larger JSON reply.
+    
+    Args:
+        success: Whether the operation succeeded
+        message: The payload (or error message) returned from the manager
+        
+    Returns:
+        Any: The payload itself, a size summary for binary payloads, or
+             ``{"error": message}`` on failure
     """
+    if not success:
+        return {"error": str(message)}
+    if isinstance(message, (bytes, bytearray)):
+        return f"Received {len(message)} bytes of binary data"
+    return message
+
+
+###########################################################################
+# CLI parsing / logging
+###########################################################################
+
+@functools.lru_cache(maxsize=1)
+def _parser() -> argparse.ArgumentParser:
+    """Build the command line parser once."""
     parser = argparse.ArgumentParser(description="Napari MCP server (socket backend)")
     parser.add_argument("--host", default="127.0.0.1", help="Napari‑socket host [default: %(default)s]")
     parser.add_argument("--port", type=int, default=64908, help="Napari‑socket port [default: %(default)s]")
     parser.add_argument("--timeout", type=float, default=20.0, help="TCP timeout seconds [default: %(default)s]")
+    parser.add_argument(
+        "--unix-path",
+        default=None,
+        help="Napari‑socket Unix domain socket, tried before TCP [default: the plugin's $XDG_RUNTIME_DIR/napari-socket.sock, else <tmpdir>/napari-socket-<uid>.sock, when --host is loopback; '' disables]",
+    )
     parser.add_argument(
         "--loglevel",
         default="INFO",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
         help="Console log‑level",
     )
-    return parser.parse_args()
+    return parser
+
+
+def _parse_args() -> argparse.Namespace:
+    """Parse command line arguments for the napari MCP server.
+    
+    Returns:
+        argparse.Namespace: Parsed command line arguments containing:
+            - host: Napari socket host (default: "127.0.0.1")
+            - port: Napari socket port (default: 64908)
+            - timeout: TCP timeout in seconds (default: 5.0)
+            - unix_path: Napari socket Unix domain socket path (default: None,
+              the plugin's per-user socket for a loopback host)
+            - loglevel: Console log level (default: "INFO")
+    """
+    return _parser().parse_args()
+
+
+def _log_dir() -> Path:
+    """Return the log directory (``$NAPARI_LOG_DIR`` or ~/napari_logs)."""
+    return Path(os.environ.get("NAPARI_LOG_DIR") or Path.home() / "napari_logs")
+
+
+class _LogFileHandler(logging.FileHandler):
+    """FileHandler that creates the log directory when the file is first opened."""
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
 
 
 def _setup_logging(level: str) -> None:
@@ -87,21 +189,29 @@ def _setup_logging(level: str) -> None:
     Args:
         level: Log level string (DEBUG, INFO, WARNING, ERROR)
         
-    Creates log files in ~/napari_logs/napari_mcp_socket.log and outputs to console.
+    Creates log files in ~/napari_logs/napari_mcp_socket.log (or under
+    $NAPARI_LOG_DIR) and outputs to console.
+    Records are handed to a background listener thread, so the file and
+    console writes stay off the tool-call path.
     """
     lvl = getattr(logging, level.upper(), logging.INFO)
 
-    log_dir = Path.home() / "napari_logs"
-    log_dir.mkdir(exist_ok=True)
-    log_file = log_dir / "bioimage_agent_socket.log"
+    log_file = _log_dir() / "bioimage_agent_socket.log"
+
+    # the QueueHandler formats each record; the listener's handlers only write it
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(
+        log_queue,
+        _LogFileHandler(log_file, delay=True),  # directory and file made on the first record
+        logging.StreamHandler(),
+    )
+    listener.start()
+    atexit.register(listener.stop)
 
     logging.basicConfig(
         level=lvl,
         format="%(asctime)s %(name)s %(levelname)s %(message)s",
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(),
-        ],
+        handlers=[logging.handlers.QueueHandler(log_queue)],
     )
 
 
@@ -109,6 +219,56 @@ def _setup_logging(level: str) -> None:
 # FastMCP definition
 ###########################################################################
 
+_SYSTEM_PROMPT = (
+    "You control a remote napari GUI through a TCP socket. "
+    "Use the screenshot tool to see the current viewport.\n\n"
+    "Available tools:\n"
+    "• open_file(path) - load image files (TIFF, PNG, ND2, NPZ, etc.)\n"
+    "• remove_layer(name_or_index) - remove a layer\n"
+    "• toggle_view() - switch between 2D and 3D view\n"
+    "• iso_contour(layer_name=None, threshold=None) - enable iso-surface rendering\n"
+    "• screenshot() - capture current view as JPG\n"
+    "• list_layers() - get info about loaded layers\n"
+    "• set_colormap(layer_name, colormap) - change layer colormap\n"
+    "• set_opacity(layer_name, opacity) - adjust layer transparency\n"
+    "• set_blending(layer_name, blending) - set layer blend mode\n"
+    "• set_contrast_limits(layer_name, min, max) - adjust contrast\n"
+    "• auto_contrast(layer_name) - auto-adjust contrast\n"
+    "• set_gamma(layer_name, gamma) - adjust gamma correction\n"
+    "• set_interpolation(layer_name, mode) - set interpolation\n"
+    "• set_timestep(timestep) - set current time point\n"
+    "• get_dims_info() - get dimension info\n"
+    "• set_camera(center, zoom, angle) - adjust camera\n"
+    "• get_camera() - get camera settings\n"
+    "• reset_camera() - reset to default view\n"
+    "• add_points(coords, properties, name) - add point annotations\n"
+    "• add_shapes(data, shape_type, name) - add shape annotations\n"
+    "• add_labels(image, name) - add segmentation masks\n"
+    "• add_surface(vertices, faces, name) - add 3D meshes\n"
+    "• add_vectors(vectors, name) - add vector fields\n"
+    "• add_labels_npy / add_points_npy / add_vectors_npy(path, name) - add from a .npy file\n"
+    "• add_surface_npz(path, name) - add a mesh from a .npz with vertices and faces\n"
+    "• save_layers(file_path, layer_names) - save layers to file\n"
+    "• get_layer_data(layer_name) - extract layer data\n"
+    "• set_scale_bar(visible, unit) - show/hide scale bar\n"
+    "• set_axis_labels(labels) - set axis labels\n"
+    "• set_view_mode(mode) - change view mode\n"
+    "• set_layer_visibility(layer_name, visible) - show/hide layer\n"
+    "• measure_distance(point1, point2) - measure between points\n"
+    "• get_layer_statistics(layer_name) - get layer stats\n"
+    "• crop_layer(layer_name, bounds) - crop layer data\n"
+    "• set_channel(index) - set current channel\n"
+    "• set_z_slice(index) - set current z-slice\n"
+    "• play_animation(start, end, fps) - play time series\n"
+    "• set_timesteps(frames, fps) - play a list of time points\n"
+    "• get_channel_info(layer_name) - get channel information for a layer\n"
+    "• split_channels(layer_name) - split multi-channel layer into separate layers\n"
+    "• merge_channels(layer_names, output_name) - merge layers into multi-channel layer\n"
+    "• call(command, args=None) - run one napari-socket command by id\n"
+    "• batch(calls) - run several napari-socket commands in one round-trip\n"
+)
+
+
 def build_mcp(manager: NapariManager) -> FastMCP:
     """Build the FastMCP server with all napari tools.
     
@@ -118,54 +278,14 @@ def build_mcp(manager: NapariManager) -> FastMCP:
     Returns:
         FastMCP: Configured MCP server with all napari tools
     """
-    prompt = (
-        "You control a remote napari GUI through a TCP socket. "
-        "Use the screenshot tool to see the current viewport.\n\n"
-        "Available tools:\n"
-        "• open_file(path) - load image files (TIFF, PNG, ND2, NPZ, etc.)\n"
-        "• remove_layer(name_or_index) - remove a layer\n"
-        "• toggle_view() - switch between 2D and 3D view\n"
-        "• iso_contour(layer_name=None, threshold=None) - enable iso-surface rendering\n"
-        "• screenshot() - capture current view as JPG\n"
-        "• list_layers() - get info about loaded layers\n"
-        "• set_colormap(layer_name, colormap) - change layer colormap\n"
-        "• set_opacity(layer_name, opacity) - adjust layer transparency\n"
-        "• set_blending(layer_name, blending) - set layer blend mode\n"
-        "• set_contrast_limits(layer_name, min, max) - adjust contrast\n"
-        "• auto_contrast(layer_name) - auto-adjust contrast\n"
-        "• set_gamma(layer_name, gamma) - adjust gamma correction\n"
-        "• set_interpolation(layer_name, mode) - set interpolation\n"
-        "• set_timestep(timestep) - set current time point\n"
-        "• get_dims_info() - get dimension info\n"
-        "• set_camera(center, zoom, angle) - adjust camera\n"
-        "• get_camera() - get camera settings\n"
-        "• reset_camera() - reset to default view\n"
-        "• add_points(coords, properties, name) - add point annotations\n"
-        "• add_shapes(data, shape_type, name) - add shape annotations\n"
-        "• add_labels(image, name) - add segmentation masks\n"
-        "• add_surface(vertices, faces, name) - add 3D meshes\n"
-        "• add_vectors(vectors, name) - add vector fields\n"
-        "• save_layers(file_path, layer_names) - save layers to file\n"
-        "• get_layer_data(layer_name) - extract layer data\n"
-        "• set_scale_bar(visible, unit) - show/hide scale bar\n"
-        "• set_axis_labels(labels) - set axis labels\n"
-        "• set_view_mode(mode) - change view mode\n"
-        "• set_layer_visibility(layer_name, visible) - show/hide layer\n"
-        "• measure_distance(point1, point2) - measure between points\n"
-        "• get_layer_statistics(layer_name) - get layer stats\n"
-        "• crop_layer(layer_name, bounds) - crop layer data\n"
-        "• set_channel(index) - set current channel\n"
-        "• set_z_slice(index) - set current z-slice\n"
-        "• play_animation(start, end, fps) - play time series\n"
-        "• get_channel_info(layer_name) - get channel information for a layer\n"
-        "• split_channels(layer_name) - split multi-channel layer into separate layers\n"
-        "• merge_channels(layer_names, output_name) - merge layers into multi-channel layer\n"
-    )
+    from mcp.server.fastmcp import FastMCP, Image
 
-    mcp = FastMCP("Napari‑Socket", instructions=prompt)
+    mcp = FastMCP("Napari‑Socket", instructions=_SYSTEM_PROMPT)
 
+    # tools are coroutines: the socket round-trip runs off the event loop
+    # (manager.acall), so a slow command doesn't stall other MCP traffic
     @mcp.tool()
-    def open_file(file_path: str) -> str:  
+    async def open_file(file_path: str) -> str:  
         """Load an image file into napari.
         
         Args:
@@ -179,11 +299,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             The file path should be absolute or relative to the current working directory.
             napari will automatically detect the file format and use the appropriate reader.
         """
-        success, message = manager.open_file(file_path)
+        success, message = await manager.acall("open_file", file_path)
         return _format_response(success, message, f"✅ Successfully loaded file: {file_path}")
 
     @mcp.tool()
-    def remove_layer(name_or_index: str | int) -> str:  
+    async def remove_layer(name_or_index: str | int) -> str:  
         """Remove a layer by name or index.
         
         Args:
@@ -196,12 +316,12 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Use list_layers() to see available layers and their indices.
             Layer indices are 0-based.
         """
-        success, message = manager.remove_layer(name_or_index)
+        success, message = await manager.acall("remove_layer", name_or_index)
         return _format_response(success, message, f"✅ Layer '{name_or_index}' removed successfully")
 
 
     @mcp.tool(name="toggle_view")
-    def toggle_view() -> str:  
+    async def toggle_view() -> str:  
         """Switch between 2D and 3D view.
         
         Returns:
@@ -211,11 +331,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Toggles between 2D (ndisplay=2) and 3D (ndisplay=3) rendering modes.
             Some features like iso-surface rendering require 3D mode.
         """
-        success, message = manager.toggle_ndisplay()
+        success, message = await manager.acall("toggle_ndisplay")
         return _format_response(success, message, "✅ View toggled successfully")
 
     @mcp.tool(name="iso_contour")
-    def iso_contour(
+    async def iso_contour(
         layer_name: str | int | None = None,
         threshold: float | None = None,
     ) -> str:  
@@ -234,28 +354,30 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Automatically switches to 3D view if needed.
             Use this for 3D volume visualization with surface rendering.
         """
-        success, message = manager.iso_contour(layer_name, threshold)
+        success, message = await manager.acall("iso_contour", layer_name, threshold)
         return _format_response(success, message, "✅ Iso-surface rendering applied successfully")
 
     @mcp.tool(name="screenshot")
-    def screenshot(filename: str | None = None) -> str:  
+    async def screenshot(filename: str | None = None) -> str:  
         """Take a screenshot of the current view.
         
         Returns:
             Image: Screenshot image object or error message prefixed with ❌
             
         Note:
-            Saves a JPG file to a temporary location and returns the image.
+            The JPG is encoded in memory and returned directly; pass
+            filename to also keep a copy on disk.
             Captures only the canvas area by default.
-            The temporary file is automatically cleaned up by the system.
         """
-        success, message = manager.screenshot(filename)
+        success, message = await manager.acall("screenshot", filename)
         if success:
+            if isinstance(message, bytes):
+                return Image(data=message, format="jpeg")
             return Image(path=message)  # message is the absolute path to the screenshot
         return f"\u274c {message}"
     
     @mcp.tool(name="list_layers")
-    def list_layers() -> str:            
+    async def list_layers() -> str:            
         """Get info about all loaded layers.
         
         Returns:
@@ -269,16 +391,16 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             - type: Layer class name (Image, Labels, Points, etc.)
             - visible: Boolean indicating if layer is visible
         """
-        success, message = manager.list_layers()
+        success, message = await manager.acall("list_layers")
         if success:
             if message is None:
                 return "[]"  # Empty list if no layers
-            return json.dumps(message, indent=2)
+            return _dumps(message)
         else:
             return f"❌ {message}"
 
     @mcp.tool(name="set_colormap")
-    def set_colormap(layer_name: str, colormap: str) -> str:
+    async def set_colormap(layer_name: str, colormap: str) -> str:
         """Change the colormap for a layer.
         
         Args:
@@ -292,11 +414,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Only works with layers that have a colormap attribute (typically Image layers).
             Common colormaps include: gray, viridis, plasma, hot, cool, rainbow, etc.
         """
-        success, message = manager.set_colormap(layer_name, colormap)
+        success, message = await manager.acall("set_colormap", layer_name, colormap)
         return _format_response(success, message, f"✅ Colormap set to '{colormap}' for layer '{layer_name}'")
 
     @mcp.tool()
-    def set_opacity(layer_name: str, opacity: float) -> str:
+    async def set_opacity(layer_name: str, opacity: float) -> str:
         """Adjust layer transparency.
         
         Args:
@@ -306,11 +428,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
         Returns:
             str: Success message or error message prefixed with ❌
         """
-        success, message = manager.set_opacity(layer_name, opacity)
+        success, message = await manager.acall("set_opacity", layer_name, opacity)
         return _format_response(success, message, f"✅ Opacity set to {opacity} for layer '{layer_name}'")
 
     @mcp.tool()
-    def set_blending(layer_name: str, blending: str) -> str:
+    async def set_blending(layer_name: str, blending: str) -> str:
         """Set how the layer blends with layers below it.
         
         Args:
@@ -327,11 +449,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             - additive: Add pixel values
             - minimum: Take minimum of pixel values
         """
-        success, message = manager.set_blending(layer_name, blending)
+        success, message = await manager.acall("set_blending", layer_name, blending)
         return _format_response(success, message, f"✅ Blending mode set to '{blending}' for layer '{layer_name}'")
 
     @mcp.tool()
-    def set_contrast_limits(layer_name: str, contrast_min: float, contrast_max: float) -> str:
+    async def set_contrast_limits(layer_name: str, contrast_min: float, contrast_max: float) -> str:
         """Set the min/max values for contrast scaling.
         
         Args:
@@ -347,11 +469,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Values outside this range will be clipped to min/max.
             Use auto_contrast() to automatically set these values.
         """
-        success, message = manager.set_contrast_limits(layer_name, contrast_min, contrast_max)
+        success, message = await manager.acall("set_contrast_limits", layer_name, contrast_min, contrast_max)
         return _format_response(success, message, f"✅ Contrast limits set to [{contrast_min}, {contrast_max}] for layer '{layer_name}'")
 
     @mcp.tool()
-    def auto_contrast(layer_name: str | None = None) -> str:
+    async def auto_contrast(layer_name: str | None = None) -> str:
         """Automatically adjust contrast to fit the data range.
         
         Args:
@@ -360,11 +482,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
         Returns:
             str: Success message with new contrast limits or error message prefixed with ❌
         """
-        success, message = manager.auto_contrast(layer_name)
+        success, message = await manager.acall("auto_contrast", layer_name)
         return _format_response(success, message, f"✅ Auto-contrast applied to layer '{layer_name}'")
 
     @mcp.tool()
-    def set_gamma(layer_name: str, gamma: float) -> str:
+    async def set_gamma(layer_name: str, gamma: float) -> str:
         """Adjust gamma correction for the layer.
         
         Args:
@@ -378,11 +500,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Gamma < 1.0 brightens dark regions, gamma > 1.0 darkens bright regions.
             Only works with layers that have a gamma attribute.
         """
-        success, message = manager.set_gamma(layer_name, gamma)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_gamma", layer_name, gamma)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def set_interpolation(layer_name: str, interpolation: str) -> str:
+    async def set_interpolation(layer_name: str, interpolation: str) -> str:
         """Set the interpolation method for zooming.
         
         Args:
@@ -398,11 +520,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             - linear: Linear interpolation (smooth)
             - cubic: Cubic interpolation (very smooth)
         """
-        success, message = manager.set_interpolation(layer_name, interpolation)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_interpolation", layer_name, interpolation)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def set_timestep(timestep: int) -> str:
+    async def set_timestep(timestep: int) -> str:
         """Jump to a specific time point.
         
         Args:
@@ -415,11 +537,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Only works if the data has a time dimension.
             Use get_dims_info() to check available dimensions.
         """
-        success, message = manager.set_timestep(timestep)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_timestep", timestep)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def get_dims_info() -> str:
+    async def get_dims_info() -> str:
         """Get info about the viewer's dimensions.
         
         Returns:
@@ -430,11 +552,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
                  - axis_labels: Labels for each dimension
                  or error message prefixed with ❌
         """
-        success, message = manager.get_dims_info()
-        return json.dumps(message, indent=2) if success else f"❌ {message}"
+        success, message = await manager.acall("get_dims_info")
+        return _format_json(success, message)
 
     @mcp.tool()
-    def set_camera(center=None, zoom=None, angle=None) -> str:
+    async def set_camera(center=None, zoom=None, angle=None) -> str:
         """Adjust camera position, zoom, and rotation.
         
         Args:
@@ -450,35 +572,35 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             In 3D mode, all parameters are used.
             Use get_camera() to see current camera settings.
         """
-        success, message = manager.set_camera(center, zoom, angle)
-        return json.dumps(message) if success else f"❌ {message}"
+        success, message = await manager.acall("set_camera", center, zoom, angle)
+        return _format_json(success, message)
 
     @mcp.tool()
-    def get_camera() -> str:
+    async def get_camera() -> str:
         """Get current camera settings.
         
         Returns:
             str: JSON-formatted camera settings including center, zoom, and angles
                  or error message prefixed with ❌
         """
-        success, message = manager.get_camera()
-        return json.dumps(message) if success else f"❌ {message}"
+        success, message = await manager.acall("get_camera")
+        return _format_json(success, message)
 
     @mcp.tool()
-    def reset_camera() -> str:
+    async def reset_camera() -> str:
         """Reset camera to default view.
         
         Returns:
             str: JSON-formatted camera settings after reset or error message prefixed with ❌
         """
-        success, message = manager.reset_camera()
-        return json.dumps(message) if success else f"❌ {message}"
+        success, message = await manager.acall("reset_camera")
+        return _format_json(success, message)
 
     # ------------------------------------------------------------------
     # Layer Creation & Annotation Functions
     # ------------------------------------------------------------------
     @mcp.tool()
-    def add_points(coordinates: list, properties: dict | None = None, name: str | None = None) -> str:
+    async def add_points(coordinates: list, properties: dict | None = None, name: str | None = None) -> str:
         """Add point markers to the viewer.
         
         Args:
@@ -494,11 +616,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             For 2D: [[x1, y1], [x2, y2], ...]
             For 3D: [[x1, y1, z1], [x2, y2, z2], ...]
         """
-        success, message = manager.add_points(coordinates, properties, name)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("add_points", coordinates, properties, name)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def add_shapes(shape_data: list, shape_type: str = 'rectangle', name: str | None = None) -> str:
+    async def add_shapes(shape_data: list, shape_type: str = 'rectangle', name: str | None = None) -> str:
         """Add shape overlays (rectangles, circles, etc.).
         
         Args:
@@ -516,11 +638,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             - line: [[[x1, y1], [x2, y2]]]
             - polygon: [[[x1, y1], [x2, y2], [x3, y3], ...]] (3+ points)
         """
-        success, message = manager.add_shapes(shape_data, shape_type, name)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("add_shapes", shape_data, shape_type, name)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def add_labels(label_image: list, name: str | None = None) -> str:
+    async def add_labels(label_image: list, name: str | None = None) -> str:
         """Add segmentation masks or labeled regions.
         
         Args:
@@ -535,11 +657,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             a different region. 0 is typically used for background.
             Each region will be displayed with a different color.
         """
-        success, message = manager.add_labels(label_image, name)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("add_labels", label_image, name)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def add_surface(vertices: list, faces: list, name: str | None = None) -> str:
+    async def add_surface(vertices: list, faces: list, name: str | None = None) -> str:
         """Add 3D mesh surface to the viewer.
         
         Args:
@@ -555,11 +677,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Faces define triangles by referencing vertex indices (0-based).
             Each face should have exactly 3 vertex indices.
         """
-        success, message = manager.add_surface(vertices, faces, name)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("add_surface", vertices, faces, name)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def add_vectors(vectors: list, name: str | None = None) -> str:
+    async def add_vectors(vectors: list, name: str | None = None) -> str:
         """Add vector field arrows to the viewer.
         
         Args:
@@ -575,14 +697,86 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             For 3D: [[[x, y, z], [dx, dy, dz]], ...]
             Each vector shows direction and magnitude at a specific position.
         """
-        success, message = manager.add_vectors(vectors, name)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("add_vectors", vectors, name)
+        return _format_response(success, message)
+
+    @mcp.tool()
+    async def add_labels_npy(path: str, name: str | None = None) -> str:
+        """Add a label image stored in a .npy or .npz file.
+        
+        Args:
+            path: Path to a .npy file (or .npz holding one array) of integer labels
+            name: Optional layer name
+                     
+        Returns:
+            str: Success message with layer name or error message prefixed with ❌
+            
+        Note:
+            Prefer this over add_labels for large masks: napari loads the file
+            directly, so the array is never serialised into the tool call.
+        """
+        success, message = await manager.acall("add_labels_npy", path, name)
+        return _format_response(success, message)
+
+    @mcp.tool()
+    async def add_points_npy(path: str, name: str | None = None) -> str:
+        """Add point markers whose coordinates are stored in a .npy or .npz file.
+        
+        Args:
+            path: Path to a .npy file (or .npz holding one array) of shape (N, D)
+            name: Optional layer name
+                     
+        Returns:
+            str: Success message with layer name or error message prefixed with ❌
+            
+        Note:
+            Prefer this over add_points for many points: napari loads the file
+            directly, so the coordinates are never serialised into the tool call.
+        """
+        success, message = await manager.acall("add_points_npy", path, name)
+        return _format_response(success, message)
+
+    @mcp.tool()
+    async def add_surface_npz(path: str, name: str | None = None) -> str:
+        """Add a 3D mesh stored in a .npz file.
+        
+        Args:
+            path: Path to a .npz file with 'vertices' (N, 3) and 'faces' (M, 3) arrays
+            name: Optional layer name
+                     
+        Returns:
+            str: Success message with layer name or error message prefixed with ❌
+            
+        Note:
+            Prefer this over add_surface for large meshes: napari loads the file
+            directly, so the arrays are never serialised into the tool call.
+        """
+        success, message = await manager.acall("add_surface_npz", path, name)
+        return _format_response(success, message)
+
+    @mcp.tool()
+    async def add_vectors_npy(path: str, name: str | None = None) -> str:
+        """Add vector field arrows stored in a .npy or .npz file.
+        
+        Args:
+            path: Path to a .npy file (or .npz holding one array) of shape (N, 2, D)
+            name: Optional layer name
+                     
+        Returns:
+            str: Success message with layer name or error message prefixed with ❌
+            
+        Note:
+            Prefer this over add_vectors for large fields: napari loads the file
+            directly, so the array is never serialised into the tool call.
+        """
+        success, message = await manager.acall("add_vectors_npy", path, name)
+        return _format_response(success, message)
 
     # ------------------------------------------------------------------
     # Data Export & Save Functions
     # ------------------------------------------------------------------
     @mcp.tool()
-    def save_layers(file_path: str, layer_names: list | None = None) -> str:
+    async def save_layers(file_path: str, layer_names: list | None = None) -> str:
         """Save one or more layers to disk.
         
         Args:
@@ -597,33 +791,34 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             For multiple layers, only the first layer is saved to the specified file.
             Layer data is saved as-is without any transformations.
         """
-        success, message = manager.save_layers(file_path, layer_names)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("save_layers", file_path, layer_names)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def get_layer_data(layer_name: str | int) -> str:
+    async def get_layer_data(layer_name: str | int) -> str:
         """Extract the raw data from a layer.
         
         Args:
             layer_name: Layer name (str) or index (int) to extract data from
             
         Returns:
-            str: JSON-formatted layer data including shape, dtype, and data array
+            str: JSON-formatted layer info including path, shape, dtype, and layer type
                  or error message prefixed with ❌
                  
         Note:
-            Returns the actual data array, shape, and data type.
-            Large arrays may be truncated in the JSON output.
+            Array data is saved to a temporary .npy file (load with numpy.load)
+            and its path is returned rather than the values themselves. The
+            file is replaced by the next call for the same layer.
             Use this to inspect layer data for analysis.
         """
-        success, message = manager.get_layer_data(layer_name)
-        return json.dumps(message, indent=2) if success else f"❌ {message}"
+        success, message = await manager.acall("get_layer_data", layer_name)
+        return _format_json(success, message)
 
     # ------------------------------------------------------------------
     # Advanced Visualization Controls
     # ------------------------------------------------------------------
     @mcp.tool()
-    def set_scale_bar(visible: bool = True, unit: str = 'um') -> str:
+    async def set_scale_bar(visible: bool = True, unit: str = 'um') -> str:
         """Show or hide the scale bar.
         
         Args:
@@ -633,11 +828,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
         Returns:
             str: Success message or error message prefixed with ❌
         """
-        success, message = manager.set_scale_bar(visible, unit)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_scale_bar", visible, unit)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def set_axis_labels(labels: list) -> str:
+    async def set_axis_labels(labels: list) -> str:
         """Set custom labels for the axes.
         
         Args:
@@ -650,11 +845,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Number of labels must match the number of dimensions in the data.
             Use get_dims_info() to see the current number of dimensions.
         """
-        success, message = manager.set_axis_labels(labels)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_axis_labels", labels)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def set_view_mode(mode: str) -> str:
+    async def set_view_mode(mode: str) -> str:
         """Switch between different view modes.
         
         Args:
@@ -663,11 +858,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
         Returns:
             str: Success message or error message prefixed with ❌
         """
-        success, message = manager.set_view_mode(mode)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_view_mode", mode)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def set_layer_visibility(layer_name: str | int, visible: bool) -> str:
+    async def set_layer_visibility(layer_name: str | int, visible: bool) -> str:
         """Show or hide a specific layer.
         
         Args:
@@ -677,14 +872,14 @@ def build_mcp(manager: NapariManager) -> FastMCP:
         Returns:
             str: Success message or error message prefixed with ❌
         """
-        success, message = manager.set_layer_visibility(layer_name, visible)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_layer_visibility", layer_name, visible)
+        return _format_response(success, message)
 
     # ------------------------------------------------------------------
     # Measurement & Analysis Functions
     # ------------------------------------------------------------------
     @mcp.tool()
-    def measure_distance(point1: list, point2: list) -> str:
+    async def measure_distance(point1: list, point2: list) -> str:
         """Calculate distance between two points in the data.
         
         Args:
@@ -699,11 +894,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Points should have the same dimensionality (both 2D or both 3D).
             Distance is calculated using Euclidean distance.
         """
-        success, message = manager.measure_distance(point1, point2)
-        return json.dumps(message, indent=2) if success else f"❌ {message}"
+        success, message = await manager.acall("measure_distance", point1, point2)
+        return _format_json(success, message)
 
     @mcp.tool()
-    def get_layer_statistics(layer_name: str | int) -> str:
+    async def get_layer_statistics(layer_name: str | int) -> str:
         """Get basic stats (min, max, mean, std) for a layer.
         
         Args:
@@ -713,11 +908,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             str: JSON-formatted statistics including min, max, mean, std, shape, and dtype
                  or error message prefixed with ❌
         """
-        success, message = manager.get_layer_statistics(layer_name)
-        return json.dumps(message, indent=2) if success else f"❌ {message}"
+        success, message = await manager.acall("get_layer_statistics", layer_name)
+        return _format_json(success, message)
 
     @mcp.tool()
-    def crop_layer(layer_name: str | int, bounds: list) -> str:
+    async def crop_layer(layer_name: str | int, bounds: list) -> str:
         """Crop a layer to a specific region.
         
         Args:
@@ -732,14 +927,14 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Creates a new layer with the cropped data.
             Use get_dims_info() to understand the dimension order.
         """
-        success, message = manager.crop_layer(layer_name, bounds)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("crop_layer", layer_name, bounds)
+        return _format_response(success, message)
 
     # ------------------------------------------------------------------
     # Time Series & Multi-dimensional Data
     # ------------------------------------------------------------------
     @mcp.tool()
-    def set_channel(channel_index: int) -> str:
+    async def set_channel(channel_index: int) -> str:
         """Switch to a specific channel in multi-channel data.
         
         Args:
@@ -753,11 +948,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Use get_dims_info() to check available dimensions.
             Channel is typically the second dimension (index 1).
         """
-        success, message = manager.set_channel(channel_index)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_channel", channel_index)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def set_z_slice(z_index: int) -> str:
+    async def set_z_slice(z_index: int) -> str:
         """Jump to a specific z-slice in 3D data.
         
         Args:
@@ -771,12 +966,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Use get_dims_info() to check available dimensions.
             Z is typically the third dimension (index 2).
         """
-        success, message = manager.set_z_slice(z_index)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_z_slice", z_index)
+        return _format_response(success, message)
 
-    #TODO currently not working
     @mcp.tool()
-    def play_animation(start_frame: int, end_frame: int, fps: int = 10) -> str:
+    async def play_animation(start_frame: int, end_frame: int, fps: int = 10) -> str:
         """Animate through a time series at specified FPS.
         
         Args:
@@ -791,16 +985,34 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Only works if the data has a time dimension.
             Use get_dims_info() to check available dimensions.
             Time is typically the first dimension (index 0).
-            Currently limited functionality - sets animation range but doesn't play continuously.
+            Playback runs inside napari; the call returns as soon as it has started.
+        """
+        success, message = await manager.acall("play_animation", start_frame, end_frame, fps)
+        return _format_response(success, message)
+
+    @mcp.tool()
+    async def set_timesteps(frames: list[int], fps: float = 10) -> str:
+        """Show a list of time points one after another.
+        
+        Args:
+            frames: Time point indices (0-based) to show, in order
+            fps: Frames per second (default: 10)
+                       
+        Returns:
+            str: Success message or error message prefixed with ❌
+                
+        Note:
+            Use this instead of repeated set_timestep calls: the whole sequence
+            is played inside napari from a single call, which returns immediately.
         """
-        success, message = manager.play_animation(start_frame, end_frame, fps)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("set_timesteps", frames, fps)
+        return _format_response(success, message)
 
     # ------------------------------------------------------------------
     # Enhanced Channel Management Functions
     # ------------------------------------------------------------------
     @mcp.tool()
-    def get_channel_info(layer_name: str | int) -> str:
+    async def get_channel_info(layer_name: str | int) -> str:
         """Get information about channels in a layer.
         
         Args:
@@ -814,11 +1026,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Returns detailed information about the layer's channel structure.
             Useful for understanding how multi-dimensional data is organized.
         """
-        success, message = manager.get_channel_info(layer_name)
-        return json.dumps(message, indent=2) if success else f"❌ {message}"
+        success, message = await manager.acall("get_channel_info", layer_name)
+        return _format_json(success, message)
 
     @mcp.tool()
-    def split_channels(layer_name: str | int) -> str:
+    async def split_channels(layer_name: str | int) -> str:
         """Split a multi-channel layer into separate single-channel layers.
         
         Args:
@@ -831,11 +1043,11 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             Automatically detects the channel axis and creates separate layers for each channel.
             Each new layer will be named with '_ch0', '_ch1', etc. suffix.
         """
-        success, message = manager.split_channels(layer_name)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("split_channels", layer_name)
+        return _format_response(success, message)
 
     @mcp.tool()
-    def merge_channels(layer_names: list, output_name: str | None = None) -> str:
+    async def merge_channels(layer_names: list, output_name: str | None = None) -> str:
         """Merge multiple single-channel layers into one multi-channel layer.
         
         Args:
@@ -850,8 +1062,63 @@ def build_mcp(manager: NapariManager) -> FastMCP:
             The merged layer will have channels as the first dimension.
             Useful for combining separate channel files into one multi-channel dataset.
         """
-        success, message = manager.merge_channels(layer_names, output_name)
-        return message if success else f"❌ {message}"
+        success, message = await manager.acall("merge_channels", layer_names, output_name)
+        return _format_response(success, message)
+
+    @mcp.tool()
+    async def call(command: str, args: list | None = None) -> str:
+        """Run a single napari-socket command by id.
+        
+        Args:
+            command: napari-socket command id such as ``"get_camera"`` (the
+                     ``napari-socket.`` prefix is optional)
+            args: Positional arguments for the command
+                        
+        Returns:
+            str: JSON for structured results, an image for screenshots, a
+                 size summary for other binary results, else the plain
+                 message; errors are prefixed with ❌
+                
+        Note:
+            A generic entry point for programmatic clients; the named tools
+            remain the documented way to drive the viewer.
+        """
+        if not command.startswith("napari-socket."):
+            command = f"napari-socket.{command}"
+        success, message = await manager.acall("send_command", command, args)
+        if success and isinstance(message, bytes) and message.startswith(b"\xff\xd8\xff"):
+            return Image(data=message, format="jpeg")  # screenshot JPG
+        return _format_result(success, message)
+
+    @mcp.tool()
+    async def batch(calls: list[dict]) -> str:
+        """Run several napari commands in a single socket round-trip.
+        
+        Args:
+            calls: List of ``{"command": str, "args": list}`` entries, where
+                   ``command`` is a napari-socket command id such as
+                   ``"set_colormap"`` or ``"toggle_ndisplay"`` (the
+                   ``napari-socket.`` prefix is optional)
+                        
+        Returns:
+            str: JSON list with one result per call, in order (``{"error": ...}``
+                 for failed calls), or error message prefixed with ❌
+                
+        Note:
+            Commands execute in order; a failing command does not stop the
+            ones after it. Use this for chains of small view changes.
+        """
+        cmds = []
+        for entry in calls:
+            command = entry.get("command")
+            if not command:
+                return f"❌ Missing 'command' in batch entry: {entry}"
+            if not command.startswith("napari-socket."):
+                command = f"napari-socket.{command}"
+            cmds.append((command, entry.get("args")))
+        results = await manager.acall("send_batch", cmds)
+        # one encoding pass over the raw values, not a list of JSON strings
+        return _dumps([_result_value(success, message) for success, message in results])
 
     return mcp
 
@@ -867,14 +1134,31 @@ def main() -> None:  # pragma: no cover
     Parses command line arguments, sets up logging, creates the NapariManager,
     builds the MCP server, and starts listening for requests.
     """
+    global _PRETTY_JSON
+
     args = _parse_args()
     _setup_logging(args.loglevel)
+    _PRETTY_JSON = args.loglevel.upper() == "DEBUG"
+
+    from napari_manager import NapariManager
 
-    mgr = NapariManager(host=args.host, port=args.port, timeout=args.timeout)
-    mcp = build_mcp(mgr)
+    try:
+        import uvloop
+    except ImportError:  # optional: stdlib asyncio loop
+        uvloop = None
 
-    _LOGGER.info("Napari MCP (socket backend) listening…")
-    mcp.run()
+    # one persistent napari connection for the lifetime of the server
+    with NapariManager(
+        host=args.host, port=args.port, timeout=args.timeout, unix_path=args.unix_path
+    ) as mgr:
+        mcp = build_mcp(mgr)
+
+        _LOGGER.info("Napari MCP (socket backend) listening…")
+        if uvloop is None:
+            mcp.run()
+        else:
+            # same stdio transport as mcp.run(), with the event loop on libuv
+            uvloop.run(mcp.run_stdio_async())
 
 
 if __name__ == "__main__":
@@ -3,8 +3,9 @@
 Socket‑based Napari Manager
 ---------------------------
 Encapsulates communication with the *napari‑socket* plugin that runs inside
-a live napari GUI session.  All interaction happens over a plain TCP socket
-(the plugin listens on 127.0.0.1:64908 by default).
+a live napari GUI session.  All interaction happens over a single persistent
+TCP connection (the plugin listens on 127.0.0.1:64908 by default), or over
+the plugin's Unix domain socket when ``unix_path`` is given.
 
 Currently we expose a single helper – ``open_file`` – as proof‑of‑concept.
 More commands from the plugin's manifest (``napari.yaml``) can be added by
@@ -12,81 +13,620 @@ calling ``NapariManager.send_command`` with the appropriate command id.
 """
 from __future__ import annotations
 
+import asyncio
+import atexit
+import contextlib
+import functools
+import io
+import ipaddress
 import json
 import logging
+import os
 import pathlib
 import socket
-from typing import Any, Sequence, Tuple
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterator, Sequence, Tuple
 import numpy as np
 
-_LOGGER = logging.getLogger(__name__)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the stdlib codec
+    orjson = None
 
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - replies stay uncompressed
+    zstandard = None
 
+_LOGGER = logging.getLogger(__name__)
 
-def _convert_numpy_for_json(obj):
-    """Convert numpy arrays to lists for JSON serialization."""
+# every message is prefixed with its byte length (4 bytes, big-endian)
+_FRAME_HEADER = struct.Struct(">I")
+# set in the length prefix of a zstd-compressed reply (remote connections only)
+_FRAME_ZSTD = 1 << 31
+# most iovecs a single sendmsg() may carry (POSIX IOV_MAX minimum on Linux)
+_IOV_MAX = 1024
+# requested kernel socket buffer size (capped by net.core.[rw]mem_max)
+_SOCK_BUFSIZE = 4_000_000
+# cap on unsent bytes queued in the kernel while a large array is streaming
+_NOTSENT_LOWAT = 128 << 10
+# TCP_NOTSENT_LOWAT is only exported by newer Pythons; 25 is the Linux value
+_TCP_NOTSENT_LOWAT = getattr(
+    socket, "TCP_NOTSENT_LOWAT", 25 if sys.platform.startswith("linux") else None
+)
+# read-only query replies are reused for this long (seconds) ...
+_QUERY_CACHE_TTL = 0.2
+# ... for at most this many distinct (command, args) pairs
+_QUERY_CACHE_SIZE = 128
+# numeric arrays at least this large travel as raw bytes after the JSON header
+_BUFFER_MIN_NBYTES = 64 * 1024
+
+
+def _np_default(obj: Any) -> Any:
+    """Encode numpy values the JSON codec cannot handle natively."""
     if isinstance(obj, np.ndarray):
         return obj.tolist()
-    elif isinstance(obj, dict):
-        return {k: _convert_numpy_for_json(v) for k, v in obj.items()}
-    elif isinstance(obj, (list, tuple)):
-        return [_convert_numpy_for_json(v) for v in obj]
-    else:
-        return obj
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+if orjson is not None:
+    # ndarrays and numpy scalars are serialised natively in C; arrays orjson
+    # cannot take as-is (non-contiguous, unsupported dtype) hit _np_default
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, default=_np_default, option=_ORJSON_OPTS)
+
+    def _loads(data: bytes | bytearray) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, as written by a plugin encoding with the stdlib
+            return json.loads(data)
+else:
+    def _dumps(obj: Any) -> bytes:
+        # the C encoder walks the containers; only numpy leaves call back
+        return json.dumps(obj, default=_np_default, separators=(",", ":")).encode()
+
+    _loads = json.loads
+
+
+def _frame(data: bytes) -> bytes:
+    """Prefix the encoded message *data* with its length."""
+    return _FRAME_HEADER.pack(len(data)) + data
+
+
+# layer name -> local .npy holding the last array fetched inline for it from a
+# remote napari; replaced on the next fetch, all removed on exit
+_LAYER_DATA_FILES: dict[str, str] = {}
+
+
+@atexit.register
+def _remove_layer_data_files() -> None:
+    for path in _LAYER_DATA_FILES.values():
+        with contextlib.suppress(OSError):
+            os.unlink(path)
+    _LAYER_DATA_FILES.clear()
+
+
+def _default_unix_path() -> str:
+    """The plugin's per-user socket: in $XDG_RUNTIME_DIR, else uid-suffixed in the temp dir."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "napari-socket.sock")
+    suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return os.path.join(tempfile.gettempdir(), f"napari-socket{suffix}.sock")
+
+
+def _is_loopback_host(host: str) -> bool:
+    """True if *host* names this machine, so the plugin's Unix socket is reachable."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+@functools.lru_cache(maxsize=256)
+def _resolve_path(raw: str) -> pathlib.Path:
+    """Expand and resolve *raw*; repeated opens of one file skip the readlink walk."""
+    return pathlib.Path(raw).expanduser().resolve()
+
+
+class _Pending:
+    """One caller's frames waiting to be sent, and the replies they got."""
+
+    __slots__ = ("frames", "n_replies", "replies", "error")
+
+    def __init__(self, frames: Sequence[bytes | memoryview], n_replies: int) -> None:
+        self.frames = frames
+        self.n_replies = n_replies
+        self.replies: list[bytes] | None = None
+        self.error: Exception | None = None
 
 
 class NapariManager:  # pylint: disable=too-few-public-methods
     """Small helper that talks to the TCP server spawned by *napari‑socket*."""
 
+    # wire bytes of zero-argument commands, which never change
+    _CMD_CACHE: dict[str, bytes] = {}
+    # encoded ``["cmd_id",`` opening of each command, so only args get serialised
+    _CMD_PREFIX: dict[str, bytes] = {}
+    # queries whose replies may be served from the short-lived cache; any
+    # other command may change viewer state and clears it
+    _READ_ONLY_CMDS = frozenset(
+        f"napari-socket.{name}"
+        for name in (
+            "list_layers", "get_layer_names", "get_dims_info", "get_camera",
+            "get_layer_statistics", "get_channel_info", "measure_distance",
+        )
+    )
+
     def __init__(
         self,
         host: str = "127.0.0.1",
         port: int = 64908,
         timeout: float = 20.0,
+        unix_path: str | None = None,
     ) -> None:
         self.host = host
         self.port = port
         self.timeout = timeout
+        # same-host Unix domain socket, preferred over TCP when it is listening;
+        # None means the plugin's per-user default for a loopback host, "" means never
+        if unix_path is None and _is_loopback_host(host):
+            unix_path = _default_unix_path()
+        self.unix_path = unix_path
+        # one lazily-opened connection, reused across commands
+        self._sock: socket.socket | None = None
+        # the open connection leads to another host (files there aren't ours)
+        self._remote = False
+        self._rfile = None
+        # reply decompressor, once negotiated with a remote plugin
+        self._zstd = None
+        # set by _send_frames once any byte of the current write left the socket
+        self._sent_any = False
+        self._lock = threading.Lock()
+        # exchanges waiting for the connection, sent as one group by the next lock holder
+        self._pending: list[_Pending] = []
+        self._pending_lock = threading.Lock()
+        # per thread: ``queued`` holds the commands of that thread's open
+        # ``batch()`` block; other threads' commands go out as usual
+        self._batch = threading.local()
+        # (cmd_id, encoded args) -> (expiry, raw reply) for read-only queries,
+        # LRU order; hits are re-parsed so no caller shares mutable results
+        self._query_cache: OrderedDict[tuple[str, bytes], tuple[float, bytes]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # bumped by clear_cache(); a query reply only enters the cache if no
+        # other command changed the viewer while it was in flight
+        self._cache_gen = 0
 
     # ---------------------------------------------------------------------
     # low‑level I/O helpers
     # ---------------------------------------------------------------------
-    def _send(self, payload: dict[str, Any] | list[Any]) -> str:
-        """Send *one* JSON payload and return the raw string reply.
+    def _connect(self):
+        """Return the buffered reader of the persistent connection, opening it if needed."""
+        if self._sock is not None and self._peer_closed():
+            self.close()
+        if self._sock is None:
+            sck = self._connect_unix()
+            if sck is None:
+                sck = self._connect_tcp()
+            # room for multi-MB array sends / layer-data replies without
+            # stalling on the ~200 KB kernel default
+            for opt in (socket.SO_SNDBUF, socket.SO_RCVBUF):
+                try:
+                    sck.setsockopt(socket.SOL_SOCKET, opt, _SOCK_BUFSIZE)
+                except OSError:
+                    pass
+            self._sock = sck
+            self._rfile = sck.makefile("rb", buffering=1 << 20)
+            self._zstd = None
+            self._remote = self._is_remote(sck)
+            if zstandard is not None and self._remote:
+                self._negotiate_zstd()
+        return self._rfile
+
+    def _peer_closed(self) -> bool:
+        """True if the idle connection was closed (or sent stray bytes) by the plugin.
+
+        Checked before every write, so a connection napari dropped while idle
+        is replaced up front instead of being noticed only after a command
+        went out on it.
+        """
+        sck = self._sock
+        try:
+            sck.setblocking(False)
+            try:
+                sck.recv(1, socket.MSG_PEEK)
+            finally:
+                sck.settimeout(self.timeout)
+        except BlockingIOError:
+            return False                    # nothing pending: still open
+        except OSError:
+            return True
+        return True                         # EOF, or data nobody asked for
+
+    @staticmethod
+    def _is_remote(sck: socket.socket) -> bool:
+        """True for TCP peers off this host, where compressing replies pays off."""
+        if sck.family not in (socket.AF_INET, socket.AF_INET6):
+            return False
+        return not ipaddress.ip_address(sck.getpeername()[0]).is_loopback
+
+    def _negotiate_zstd(self) -> None:
+        """Ask the plugin to zstd-compress large replies on this connection."""
+        self._sock.sendall(_frame(_dumps({"hello": {"zstd": True}})))
+        if self._read_frame(self._rfile) == b"OK":
+            self._zstd = zstandard.ZstdDecompressor()
+
+    def _connect_unix(self) -> socket.socket | None:
+        """Connect to ``unix_path``, or return None if nothing listens there."""
+        if not self.unix_path or not hasattr(socket, "AF_UNIX"):
+            return None
+        sck = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sck.settimeout(self.timeout)
+        try:
+            sck.connect(self.unix_path)
+        except OSError as exc:
+            sck.close()
+            _LOGGER.debug("Unix socket %s unavailable (%s), using TCP", self.unix_path, exc)
+            return None
+        return sck
+
+    def _connect_tcp(self) -> socket.socket:
+        sck = socket.create_connection((self.host, self.port), self.timeout)
+        try:
+            # flush each small command immediately instead of letting
+            # Nagle hold it back waiting for more data / a delayed ACK
+            sck.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            # notice a vanished napari on the long-lived idle connection
+            sck.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        except OSError:
+            pass
+        if hasattr(socket, "TCP_QUICKACK"):  # Linux: don't delay the first ACKs
+            try:
+                sck.setsockopt(socket.IPPROTO_TCP, socket.TCP_QUICKACK, 1)
+            except OSError:
+                pass
+        if _TCP_NOTSENT_LOWAT is not None:
+            # keep interactive commands from queueing behind MBs of array data
+            try:
+                sck.setsockopt(socket.IPPROTO_TCP, _TCP_NOTSENT_LOWAT, _NOTSENT_LOWAT)
+            except OSError:
+                pass
+        return sck
+
+    def close(self) -> None:
+        """Close the persistent connection (it is reopened on the next command)."""
+        if self._rfile is not None:
+            self._rfile.close()
+            self._rfile = None
+        if self._sock is not None:
+            self._sock.close()
+            self._sock = None
+
+    def __enter__(self) -> "NapariManager":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _submit(self, frames: Sequence[bytes | memoryview], n_replies: int) -> list[bytes]:
+        """Exchange *frames* for *n_replies* replies, sharing the round-trip with concurrent callers.
+
+        Callers that queue up while another exchange is in flight are written
+        and answered together by whichever of them gets the connection next,
+        so parallel tool calls cost one round-trip instead of one each.
+        """
+        mine = _Pending(frames, n_replies)
+        with self._pending_lock:
+            self._pending.append(mine)
+        with self._lock:
+            if mine.replies is None and mine.error is None:
+                with self._pending_lock:
+                    group, self._pending = self._pending, []
+                try:
+                    replies = self._exchange(
+                        [frame for p in group for frame in p.frames],
+                        sum(p.n_replies for p in group),
+                    )
+                except Exception as exc:  # every caller in the group sees it
+                    for p in group:
+                        p.error = exc
+                else:
+                    start = 0
+                    for p in group:
+                        p.replies = replies[start:start + p.n_replies]
+                        start += p.n_replies
+        if mine.error is not None:
+            raise mine.error
+        return mine.replies
+
+    def _exchange(self, frames: Sequence[bytes | memoryview], n_replies: int) -> list[bytes]:
+        """Write *frames* and read *n_replies* reply frames over the persistent connection.
+
+        The caller holds ``self._lock``.  Only a failure to connect, or a
+        write that failed before a single byte went out, is retried (once, on
+        a fresh connection).  Once any part of the frames is out the commands
+        may run, so a connection lost after that is reported, never answered
+        by sending them again.
+        """
+        retried = False
+        while True:
+            self._sent_any = False
+            try:
+                rfile = self._connect()
+                self._send_frames(frames)
+            except OSError as exc:
+                self.close()
+                # retry only when nothing of the commands can have reached napari;
+                # a timeout has already used up the deadline
+                if retried or self._sent_any or isinstance(exc, socket.timeout):
+                    raise
+                retried = True
+                continue
+            break
+        replies: list[bytes] = []
+        try:
+            while len(replies) < n_replies:
+                reply = self._read_frame(rfile)
+                if reply is None:
+                    raise ConnectionError("napari-socket closed the connection")
+                replies.append(reply)
+        except (OSError, EOFError):
+            self.close()
+            raise
+        return replies
+
+    def _send_frames(self, frames: Sequence[bytes | memoryview]) -> None:
+        """Gather-write *frames* (header + array buffers) with as few syscalls as possible."""
+        sck = self._sock
+        if not hasattr(sck, "sendmsg"):     # Windows
+            # sendall doesn't say how much went out before it failed
+            self._sent_any = True
+            for frame in frames:
+                sck.sendall(frame)
+            return
+        views = [memoryview(frame).cast("B") for frame in frames]
+        first = 0
+        while first < len(views):
+            sent = sck.sendmsg(views[first:first + _IOV_MAX])
+            if sent:
+                self._sent_any = True
+            # drop what went out; a partially sent frame keeps its tail
+            while sent:
+                size = views[first].nbytes
+                if sent < size:
+                    views[first] = views[first][sent:]
+                    break
+                sent -= size
+                first += 1
+
+    def _read_frame(self, rfile) -> bytearray | bytes | None:
+        """Read one length-prefixed reply into a preallocated buffer (None on EOF)."""
+        header = rfile.read(_FRAME_HEADER.size)
+        if not header:
+            return None
+        if len(header) < _FRAME_HEADER.size:
+            raise EOFError("napari-socket closed the connection mid-reply")
+        (size,) = _FRAME_HEADER.unpack(header)
+        compressed = size & _FRAME_ZSTD
+        if compressed and self._zstd is None:
+            raise ConnectionError("napari-socket sent a compressed reply that was never negotiated")
+        size &= ~_FRAME_ZSTD
+        reply = bytearray(size)
+        if rfile.readinto(reply) != size:
+            raise EOFError("napari-socket closed the connection mid-reply")
+        if compressed:
+            return self._zstd.decompress(reply)
+        return reply
 
-        The *napari‑socket* plugin expects **exactly** one JSON line per
-        connection and responds with a single line that starts with either
-        ``"OK"`` or ``"ERR ..."``.
+    @classmethod
+    def _encode(cls, payload: list[Any]) -> list[bytes | memoryview]:
+        """Serialise one ``[cmd_id, args]`` command into wire frames.
+
+        Large numeric ndarray arguments (also as dict-argument values) are
+        replaced by ``{"__buffer__": i}`` placeholders and sent as raw bytes
+        right after a JSON header frame
+        ``{"cmd", "args", "buffers": [{"dtype", "shape", "nbytes"}, ...]}``;
+        everything else goes out as a single length-prefixed JSON frame.
         """
-        # Convert numpy arrays to lists for JSON serialization
-        payload = _convert_numpy_for_json(payload)
-        data = json.dumps(payload).encode() + b"\n"
+        cmd_id, args = payload
+        if not args:
+            data = cls._CMD_CACHE.get(cmd_id)
+            if data is None:
+                data = cls._CMD_CACHE[cmd_id] = _frame(_dumps(payload))
+            _LOGGER.debug("→ %s", data)
+            return [data]
+        buffers: list[np.ndarray] = []
+
+        def hoist(value: Any) -> Any:
+            if (
+                isinstance(value, np.ndarray)
+                and value.dtype.kind in "biuf"
+                and value.nbytes >= _BUFFER_MIN_NBYTES
+            ):
+                buffers.append(np.ascontiguousarray(value))
+                return {"__buffer__": len(buffers) - 1}
+            return value
+
+        # top-level args plus the values of dict args (e.g. point ``properties``)
+        wire_args = [
+            {k: hoist(v) for k, v in arg.items()} if isinstance(arg, dict) else hoist(arg)
+            for arg in args
+        ]
+        if not buffers:
+            prefix = cls._CMD_PREFIX.get(cmd_id)
+            if prefix is None:
+                prefix = cls._CMD_PREFIX[cmd_id] = b"[" + _dumps(cmd_id) + b","
+            data = _frame(prefix + _dumps(args) + b"]")
+            _LOGGER.debug("→ %s", data)
+            return [data]
+        header = {
+            "cmd": cmd_id,
+            "args": wire_args,
+            "buffers": [
+                {"dtype": a.dtype.str, "shape": list(a.shape), "nbytes": a.nbytes}
+                for a in buffers
+            ],
+        }
+        data = _frame(_dumps(header))
         _LOGGER.debug("→ %s", data)
+        # memoryviews let sendall() read the array memory without a copy
+        return [data, *(memoryview(a).cast("B") for a in buffers)]
 
-        with socket.create_connection((self.host, self.port), self.timeout) as sck:
-            sck.sendall(data)
-            reply = sck.recv(8192).decode().strip()
+    def _send(self, payload: dict[str, Any] | list[Any]) -> bytes:
+        """Send *one* JSON payload and return the raw reply bytes.
 
+        Commands are length-prefixed JSON frames sent over a persistent
+        connection; the *napari‑socket* plugin answers each with one frame
+        that starts with either ``"OK"`` or ``"ERR ..."``.
+        """
+        reply = self._submit(self._encode(payload), 1)[0]
         _LOGGER.debug("← %s", reply)
         return reply
 
+    @staticmethod
+    def _parse_reply(reply: bytes) -> Tuple[bool, Any]:
+        """Turn a raw ``OK``/``ERR`` reply frame into *(success, message)*.
+
+        The JSON payload is decoded straight from the received bytes;
+        ``OKS`` replies carry a plain string and ``OKB`` replies raw bytes,
+        both skipping JSON decoding.  The reply kind is told apart by the
+        single byte after ``OK``.
+        """
+        if not reply.startswith(b"OK"):
+            return False, reply.decode()
+        kind = reply[2:3]
+        if kind == b" ":                  # JSON payload
+            try:
+                return True, _loads(reply[3:])
+            except ValueError:             # JSONDecodeError (stdlib or orjson)
+                return True, reply[3:].decode().strip()  # plain text (older plugins)
+        if kind == b"S":                  # plain-string payload
+            return True, reply[4:].decode()
+        if kind == b"B":                  # binary payload
+            return True, bytes(memoryview(reply)[4:])
+        return True, None                 # bare ``OK``
+
     # ------------------------------------------------------------------
     # public API
     # ------------------------------------------------------------------
     def send_command(self, cmd_id: str, args: Sequence[Any] | None = None) -> Tuple[bool, Any]:
-        """Invoke *cmd_id* inside napari and return *(success, message)*."""
-        payload: list[Any] = [cmd_id, list(args or [])]
-        reply = self._send(payload)
-        if reply == "OK":                 # no payload
+        """Invoke *cmd_id* inside napari and return *(success, message)*.
+
+        Inside a ``batch()`` block on this thread the command is only queued and
+        ``(True, None)`` is returned straight away.
+        """
+        queued = getattr(self._batch, "queued", None)
+        if queued is not None:
+            queued.append((cmd_id, list(args or [])))
             return True, None
-        if reply.startswith("OK "):       # payload present
-            payload = reply[3:].strip()
+        payload: list[Any] = [cmd_id, list(args or [])]
+        if cmd_id not in self._READ_ONLY_CMDS:
+            self.clear_cache()
             try:
-                payload = json.loads(payload)
-            except json.JSONDecodeError:
-                pass                       # plain-text payload
-            return True, payload
-        return False, reply
+                return self._parse_reply(self._send(payload))
+            finally:
+                self.clear_cache()           # drop queries answered meanwhile
+
+        key = (cmd_id, _dumps(payload[1]))
+        now = time.monotonic()
+        with self._cache_lock:
+            hit = self._query_cache.get(key)
+            if hit is not None and hit[0] > now:
+                self._query_cache.move_to_end(key)
+                return self._parse_reply(hit[1])
+            gen = self._cache_gen
+        reply = bytes(self._send(payload))
+        result = self._parse_reply(reply)
+        if result[0]:
+            with self._cache_lock:
+                if gen == self._cache_gen:
+                    self._query_cache[key] = (now + _QUERY_CACHE_TTL, reply)
+                    self._query_cache.move_to_end(key)
+                    if len(self._query_cache) > _QUERY_CACHE_SIZE:
+                        self._query_cache.popitem(last=False)
+        return result
+
+    def clear_cache(self) -> None:
+        """Forget cached query replies (done automatically before any other command)."""
+        with self._cache_lock:
+            self._query_cache.clear()
+            self._cache_gen += 1
+
+    def send_batch(self, cmds: Sequence[tuple[str, Sequence[Any] | None]]) -> list[Tuple[bool, Any]]:
+        """Pipeline several ``(cmd_id, args)`` commands in a single round-trip.
+
+        All commands are written at once and the replies are read back in
+        order, so *N* commands cost one RTT instead of *N*.
+        """
+        if not cmds:
+            return []
+        self.clear_cache()
+        # coalesce consecutive JSON frames so plain commands still go out in one write
+        frames: list[bytes | memoryview] = []
+        pending: list[bytes] = []
+        for cmd_id, args in cmds:
+            header, *buffers = self._encode([cmd_id, list(args or [])])
+            pending.append(header)
+            if buffers:
+                frames.append(b"".join(pending))
+                frames.extend(buffers)
+                pending = []
+        if pending:
+            frames.append(b"".join(pending))
+        try:
+            replies = self._submit(frames, len(cmds))
+        finally:
+            self.clear_cache()
+        results = []
+        for reply in replies:
+            _LOGGER.debug("← %s", reply)
+            results.append(self._parse_reply(reply))
+        return results
+
+    @contextlib.contextmanager
+    def batch(self) -> Iterator[list[Tuple[bool, Any]]]:
+        """Queue every command issued inside the block and send them together.
+
+        Helpers called inside the block (on the same thread) return
+        ``(True, None)`` immediately; the yielded list is filled with the real
+        *(success, message)* replies, in call order, once the block exits
+        without an exception::
+
+            with mgr.batch() as results:
+                mgr.set_colormap("cells", "magma")
+                mgr.set_opacity("cells", 0.5)
+        """
+        if getattr(self._batch, "queued", None) is not None:  # nested: join the outer batch
+            yield []
+            return
+        results: list[Tuple[bool, Any]] = []
+        self._batch.queued = []
+        try:
+            yield results
+            queued = self._batch.queued
+        finally:
+            self._batch.queued = None
+        results.extend(self.send_batch(queued))
+
+    async def acall(self, method: str, *args: Any) -> Any:
+        """Await helper *method* without blocking the running event loop.
+
+        The blocking socket exchange runs in a worker thread; concurrent
+        callers are still serialised on the one connection by its lock.
+        """
+        return await asyncio.to_thread(getattr(self, method), *args)
 
     # ------------------------------------------------------------------
     # high‑level helpers
@@ -97,7 +637,7 @@ class NapariManager:  # pylint: disable=too-few-public-methods
         The command id is *napari‑socket.open_file* as declared in the plugin's
         manifest.
         """
-        path = pathlib.Path(file_path).expanduser().resolve()
+        path = _resolve_path(str(file_path))
         if not path.exists():
             return False, f"File not found: {path}"
 
@@ -145,11 +685,15 @@ class NapariManager:  # pylint: disable=too-few-public-methods
     # ------------------------------------------------------------------
     # screenshot helper
     # ------------------------------------------------------------------
-    def screenshot(self, filename: str | None = None) -> tuple[bool, str]:
-        """Ask the remote viewer to save a JPG screenshot and return the absolute path as a string."""
-        args = []
+    def screenshot(self, filename: str | None = None) -> tuple[bool, bytes | str]:
+        """Take a JPG screenshot of the remote viewer.
+
+        Returns the JPG bytes, or, when *filename* is given, saves the image
+        there and returns its absolute path as a string.
+        """
+        args: list[Any] = []
         if filename is not None:
-            args.append(filename)
+            args = [True, filename]       # canvas_only, filename
         return self.send_command("napari-socket.screenshot", args)
 
     # ------------------------------------------------------------------
@@ -203,20 +747,7 @@ class NapariManager:  # pylint: disable=too-few-public-methods
 
     def set_camera(self, center=None, zoom=None, angle=None) -> Tuple[bool, Any]:
         """Adjust camera position, zoom, and rotation."""
-        args = []
-        if center is not None:
-            args.append(center)
-        else:
-            args.append(None)
-        if zoom is not None:
-            args.append(zoom)
-        else:
-            args.append(None)
-        if angle is not None:
-            args.append(angle)
-        else:
-            args.append(None)
-        return self.send_command("napari-socket.set_camera", args)
+        return self.send_command("napari-socket.set_camera", [center, zoom, angle])
 
     def get_camera(self) -> Tuple[bool, Any]:
         """Get current camera settings."""
@@ -266,6 +797,23 @@ class NapariManager:  # pylint: disable=too-few-public-methods
             args.append(name)
         return self.send_command("napari-socket.add_vectors", args)
 
+    # file-backed variants: napari loads the array itself, only the path is sent
+    def add_labels_npy(self, path: str | pathlib.Path, name: str | None = None) -> Tuple[bool, Any]:
+        """Add a label image from a ``.npy``/``.npz`` file."""
+        return self.send_command("napari-socket.add_labels_npy", [str(_resolve_path(str(path))), name])
+
+    def add_points_npy(self, path: str | pathlib.Path, name: str | None = None) -> Tuple[bool, Any]:
+        """Add point markers from a ``.npy``/``.npz`` file of coordinates."""
+        return self.send_command("napari-socket.add_points_npy", [str(_resolve_path(str(path))), name])
+
+    def add_surface_npz(self, path: str | pathlib.Path, name: str | None = None) -> Tuple[bool, Any]:
+        """Add a 3D mesh from a ``.npz`` file with ``vertices`` and ``faces``."""
+        return self.send_command("napari-socket.add_surface_npz", [str(_resolve_path(str(path))), name])
+
+    def add_vectors_npy(self, path: str | pathlib.Path, name: str | None = None) -> Tuple[bool, Any]:
+        """Add vector field arrows from a ``.npy``/``.npz`` file."""
+        return self.send_command("napari-socket.add_vectors_npy", [str(_resolve_path(str(path))), name])
+
     # ------------------------------------------------------------------
     # Data Export & Save Functions
     # ------------------------------------------------------------------
@@ -277,8 +825,35 @@ class NapariManager:  # pylint: disable=too-few-public-methods
         return self.send_command("napari-socket.save_layers", args)
 
     def get_layer_data(self, layer_name: str | int) -> Tuple[bool, Any]:
-        """Extract the raw data from a layer."""
-        return self.send_command("napari-socket.get_layer_data", [layer_name])
+        """Extract the raw data from a layer.
+
+        Array data comes back as ``{"path", "shape", "dtype", "layer_type"}``
+        with the values in a ``.npy`` file on this host; see
+        ``load_layer_data_npy``.  From a napari on another host the array
+        travels inline in the reply and is written to a local file here.
+        """
+        with self._lock:
+            self._connect()
+            remote = self._remote
+        success, message = self.send_command("napari-socket.get_layer_data", [layer_name, remote])
+        if not (success and isinstance(message, bytes)):
+            return success, message
+        with np.load(io.BytesIO(message)) as npz:
+            data, layer_type = npz["data"], str(npz["layer_type"])
+        fd, path = tempfile.mkstemp(prefix="napari_layer_", suffix=".npy")
+        with os.fdopen(fd, "wb") as f:
+            np.save(f, data)
+        previous = _LAYER_DATA_FILES.pop(str(layer_name), None)
+        _LAYER_DATA_FILES[str(layer_name)] = path
+        if previous is not None:
+            with contextlib.suppress(OSError):
+                os.unlink(previous)
+        return True, {"path": path, "shape": data.shape, "dtype": str(data.dtype), "layer_type": layer_type}
+
+    @staticmethod
+    def load_layer_data_npy(path: str | pathlib.Path) -> np.ndarray:
+        """Memory-map the ``.npy`` file written by ``get_layer_data``."""
+        return np.load(path, mmap_mode="r")
 
     # ------------------------------------------------------------------
     # Advanced Visualization Controls
@@ -329,6 +904,10 @@ class NapariManager:  # pylint: disable=too-few-public-methods
         """Animate through a time series at specified FPS."""
         return self.send_command("napari-socket.play_animation", [start_frame, end_frame, fps])
 
+    def set_timesteps(self, frames: Sequence[int], fps: float = 10) -> Tuple[bool, Any]:
+        """Step through an arbitrary list of time points at *fps*, driven inside napari."""
+        return self.send_command("napari-socket.set_timesteps", [list(frames), fps])
+
     # ------------------------------------------------------------------
     # Enhanced Channel Management Functions
     # ------------------------------------------------------------------
@@ -1,9 +1,14 @@
 from pathlib import Path
 from napari.viewer import Viewer
+import atexit
+import io
+import os
 import numpy as np
 import collections.abc
 import json
+import struct
 import tifffile
+import zipfile
 
 def _detect_channel_axis(data_shape, axes_string=None):
     """Detect which axis corresponds to channels in multi-dimensional data.
@@ -34,6 +39,19 @@ def _detect_channel_axis(data_shape, axes_string=None):
     
     return None
 
+def _read_tiff_series(path, series):
+    """Return the pixels of *series*, the file's first, memory-mapped when possible.
+
+    Uncompressed, contiguously stored series are mapped instead of read, so
+    only the planes napari actually displays are paged in.
+    """
+    if getattr(series, 'dataoffset', None) is not None:
+        try:
+            return tifffile.memmap(path, series=0, mode='r')
+        except ValueError:  # not memory-mappable after all
+            pass
+    return series.asarray()
+
 def _open_tiff_with_channels(path, viewer, plugin=None, layer_type=None):
     """Open a TIFF file and create separate layers for each channel.
     
@@ -50,24 +68,26 @@ def _open_tiff_with_channels(path, viewer, plugin=None, layer_type=None):
         with tifffile.TiffFile(path) as tif:
             # Get the first series (most TIFF files have one series)
             series = tif.series[0]
-            data = series.asarray()
             axes = getattr(series, 'axes', None)
             
-            # Detect channel axis
-            channel_axis = _detect_channel_axis(data.shape, axes)
+            # Detect channel axis from the metadata – no pixels read yet
+            channel_axis = _detect_channel_axis(series.shape, axes)
             
             if channel_axis is None:
                 # No channel axis detected, use standard opening
                 layers = viewer.open(path, plugin=plugin or "napari", layer_type=layer_type)
                 return layers[0] if layers else None
             
+            data = _read_tiff_series(path, series)
+            
             # Create separate layers for each channel
             created_layers = []
             n_channels = data.shape[channel_axis]
             
             for channel_idx in range(n_channels):
-                # Extract channel data
-                channel_data = np.take(data, channel_idx, axis=channel_axis)
+                # Extract channel data (a view, so memory-mapped pages load lazily)
+                index = (slice(None),) * channel_axis + (channel_idx,)
+                channel_data = data[index]
                 
                 # Create layer name
                 layer_name = f"{path.stem}_ch{channel_idx}"
@@ -152,11 +172,11 @@ def iso_contour(
     # resolve which layers to edit
     if layer_name is None:
         # Only apply to Image layers that support iso-surface rendering
-        targets = [lyr for lyr in viewer.layers if hasattr(lyr, "rendering") and hasattr(lyr, "iso_threshold")]
+        targets = [lyr for lyr in viewer.layers if _has_attr(lyr, "rendering") and _has_attr(lyr, "iso_threshold")]
     else:
         layer = viewer.layers[layer_name] if isinstance(layer_name, int) else viewer.layers[layer_name]
         # Check if the layer supports iso-surface rendering
-        if hasattr(layer, "rendering") and hasattr(layer, "iso_threshold"):
+        if _has_attr(layer, "rendering") and _has_attr(layer, "iso_threshold"):
             targets = [layer]
         else:
             return 0  # No layers modified
@@ -178,47 +198,55 @@ def screenshot(
     canvas_only: bool = True,
     filename: str | None = None,           # optional filename parameter
     viewer: Viewer | None = None,          # injected by napari
-) -> str:
+) -> str | bytes:
     """
     Take a screenshot of the current napari viewer.
     
-    Saves a JPG file and returns the file path.
+    Returns the JPG-encoded bytes, encoded in memory.
     Set canvas_only=False to capture the full UI instead of just the canvas.
-    If filename is provided, saves to that location; otherwise saves to temp folder.
+    If filename is provided, saves a JPG file there and returns its path instead.
     """
-    import os
-    import tempfile
     from PIL import Image
 
-    screenshot_array = viewer.screenshot(canvas_only=canvas_only)
-    img = Image.fromarray(screenshot_array)
+    screenshot_array = np.ascontiguousarray(viewer.screenshot(canvas_only=canvas_only), dtype=np.uint8)
+    if screenshot_array.ndim == 3 and screenshot_array.shape[2] == 4:
+        # wrap the RGBA buffer as RGBX without copying; the JPEG encoder skips the pad byte
+        height, width = screenshot_array.shape[:2]
+        img = Image.frombuffer("RGBX", (width, height), screenshot_array, "raw", "RGBX", 0, 1)
+    else:
+        img = Image.fromarray(screenshot_array).convert("RGB")  # Ensure no alpha channel for JPG
     
     if filename is not None:
         # Use provided filename
         if not filename.endswith(('.jpg', '.jpeg')):
             filename += '.jpg'  # Add .jpg extension if not present
-        img = img.convert("RGB")  # Ensure no alpha channel for JPG
         img.save(filename, format="JPEG")
         return os.path.abspath(filename)
-    else:
-        # Use temporary file as before
-        fd, tmp = tempfile.mkstemp(prefix="napari_scr_", suffix=".jpg")
-        os.close(fd)
-        img = img.convert("RGB")  # Ensure no alpha channel for JPG
-        img.save(tmp, format="JPEG")
-        return os.path.abspath(tmp)
+
+    buf = io.BytesIO()
+    img.save(buf, format="JPEG")
+    return buf.getvalue()
 
 # ----------------------------------------------------------------------
 # layer introspection
 # ----------------------------------------------------------------------
 
+_JSON_SCALARS = (str, int, float, bool, type(None))
+
+
 def to_serializable(obj):
     """Recursively convert an object to something JSON-serializable."""
-    if isinstance(obj, (str, int, float, bool)) or obj is None:
+    if isinstance(obj, _JSON_SCALARS):
         return obj
+    # arrays before containers: item() for single values, else their repr
+    elif isinstance(obj, np.ndarray):
+        return obj.item() if obj.size == 1 else str(obj)
     elif isinstance(obj, dict):
         return {str(k): to_serializable(v) for k, v in obj.items()}
     elif isinstance(obj, (list, tuple, set)):
+        # flat scalar sequences (nsteps, current_step, ...) need no per-item recursion
+        if all(type(v) in _JSON_SCALARS for v in obj):
+            return list(obj)
         return [to_serializable(v) for v in obj]
     # numpy types
     elif hasattr(obj, 'item') and callable(obj.item):
@@ -238,15 +266,16 @@ def list_layers(viewer: Viewer):
     list[dict]
         One dict per layer with ``index``, ``name``, ``type``, and ``visible``.
     """
-    return to_serializable([
+    # every field is already a plain str/int/bool – no to_serializable pass
+    return [
         {
             "index": i,
             "name": layer.name,
             "type": layer.__class__.__name__,
-            "visible": layer.visible,
+            "visible": bool(layer.visible),
         }
         for i, layer in enumerate(viewer.layers)
-    ])
+    ]
 
 def get_layer_names(viewer: Viewer):
     """
@@ -267,7 +296,7 @@ def set_colormap(
     """Change the colormap for a layer."""
     try:
         layer = _get_layer(viewer, layer_name)
-        if hasattr(layer, 'colormap'):
+        if _has_attr(layer, 'colormap'):
             layer.colormap = colormap
             return f"Colormap for layer '{layer.name}' set to '{colormap}'."
         
@@ -277,6 +306,18 @@ def set_colormap(
         available_layers = [layer.name for layer in viewer.layers]
         return f"Layer '{layer_name}' not found. Available layers: {available_layers}"
 
+# layer classes are few and fixed, so which attributes they expose is probed
+# once per (class, name) rather than on every call
+_CLASS_HAS_ATTR: dict = {}
+
+def _has_attr(layer, name: str) -> bool:
+    """``hasattr`` for layer attributes, cached per layer class."""
+    key = (type(layer), name)
+    found = _CLASS_HAS_ATTR.get(key)
+    if found is None:
+        found = _CLASS_HAS_ATTR[key] = hasattr(layer, name)
+    return found
+
 def _get_layer(viewer: Viewer, layer_name: str | int | None = None):
     """Get a layer by name/index or return the active layer."""
     if layer_name is not None:
@@ -296,7 +337,7 @@ def set_opacity(
     """Adjust layer transparency (0=transparent, 1=opaque)."""
     try:
         layer = _get_layer(viewer, layer_name)
-        if hasattr(layer, 'opacity'):
+        if _has_attr(layer, 'opacity'):
             layer.opacity = opacity
             return f"Opacity for layer '{layer.name}' set to {opacity}."
         return f"Layer '{layer.name}' does not have an opacity attribute."
@@ -312,7 +353,7 @@ def set_blending(
         ):
     """Set how the layer blends with layers below it."""
     layer = _get_layer(viewer, layer_name)
-    if hasattr(layer, 'blending'):
+    if _has_attr(layer, 'blending'):
         layer.blending = blending
         return f"Blending mode for layer '{layer.name}' set to '{blending}'."
     return f"Layer '{layer.name}' does not have a blending attribute."
@@ -325,7 +366,7 @@ def set_contrast_limits(
     ):
     """Set the min/max values for contrast scaling."""
     layer = _get_layer(viewer, layer_name)
-    if hasattr(layer, 'contrast_limits'):
+    if _has_attr(layer, 'contrast_limits'):
         layer.contrast_limits = (contrast_min, contrast_max)
         return f"Contrast limits for layer '{layer.name}' set to ({contrast_min}, {contrast_max})."
     return f"Layer '{layer.name}' does not have a contrast_limits attribute."
@@ -336,7 +377,7 @@ def auto_contrast(
     ):
     """Automatically adjust contrast to fit the data range."""
     layer = _get_layer(viewer, layer_name)
-    if hasattr(layer, 'reset_contrast_limits'):
+    if _has_attr(layer, 'reset_contrast_limits'):
         layer.reset_contrast_limits()
         return f"Auto-contrasted layer '{layer.name}'. New limits: {layer.contrast_limits}."
     return f"Layer '{layer.name}' does not have auto-contrast capability."
@@ -348,7 +389,7 @@ def set_gamma(
         ):
     """Adjust gamma correction for the layer."""
     layer = _get_layer(viewer, layer_name)
-    if hasattr(layer, 'gamma'):
+    if _has_attr(layer, 'gamma'):
         layer.gamma = gamma
         return f"Gamma for layer '{layer.name}' set to {gamma}."
     return f"Layer '{layer.name}' does not have a gamma attribute."
@@ -360,7 +401,7 @@ def set_interpolation(
         ):
     """Set the interpolation method for zooming."""
     layer = _get_layer(viewer, layer_name)
-    if hasattr(layer, 'interpolation'):
+    if _has_attr(layer, 'interpolation'):
         layer.interpolation = interpolation
         return f"Interpolation for layer '{layer.name}' set to '{interpolation}'."
     return f"Layer '{layer.name}' does not have an interpolation attribute."
@@ -499,6 +540,88 @@ def add_vectors(
     layer = viewer.add_vectors(vectors, name=name)
     return f"Added vectors layer '{layer.name}' with shape {vectors.shape}."
 
+def _map_npz(path: Path) -> np.ndarray | None:
+    """Memory-map the array of an uncompressed (``np.savez``) single-array .npz.
+
+    Returns None when the archive is compressed or otherwise can't be mapped.
+    """
+    with zipfile.ZipFile(path) as zf:
+        infos = zf.infolist()
+        if len(infos) != 1 or infos[0].compress_type != zipfile.ZIP_STORED:
+            return None
+        info = infos[0]
+        with zf.open(info) as member:
+            version = np.lib.format.read_magic(member)
+            if version == (1, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_1_0(member)
+            elif version == (2, 0):
+                shape, fortran, dtype = np.lib.format.read_array_header_2_0(member)
+            else:
+                return None
+            header_len = member.tell()
+    if dtype.hasobject:
+        return None
+    # the member's data follows its local header, whose name/extra lengths
+    # may differ from the central directory's
+    with open(path, 'rb') as fh:
+        fh.seek(info.header_offset + 26)
+        name_len, extra_len = struct.unpack('<HH', fh.read(4))
+    offset = info.header_offset + 30 + name_len + extra_len + header_len
+    return np.memmap(path, dtype=dtype, mode='c', shape=shape,
+                     order='F' if fortran else 'C', offset=offset)
+
+def _load_array(path: str) -> np.ndarray:
+    """Load the array stored in a ``.npy`` or single-array ``.npz`` file.
+
+    ``.npy`` files and ``.npz`` files written with ``np.savez`` (not
+    ``savez_compressed``) are memory-mapped instead of read.
+    """
+    path = Path(path).expanduser()
+    if path.suffix.lower() == '.npz':
+        mapped = _map_npz(path)
+        if mapped is not None:
+            return mapped
+        with np.load(path) as npz:
+            if len(npz.files) != 1:
+                raise ValueError(f"{path} holds {len(npz.files)} arrays, expected one")
+            return npz[npz.files[0]]
+    # copy-on-write map: pages load lazily and the layer stays editable
+    return np.load(path, mmap_mode='c')
+
+def add_labels_npy(
+    path: str,
+    name: str | None = None,
+    viewer: Viewer = None,
+):
+    """Add a label image stored in a .npy/.npz file to the viewer."""
+    return add_labels(_load_array(path), name=name, viewer=viewer)
+
+def add_points_npy(
+    path: str,
+    name: str | None = None,
+    viewer: Viewer = None,
+):
+    """Add point coordinates stored in a .npy/.npz file to the viewer."""
+    return add_points(_load_array(path), name=name, viewer=viewer)
+
+def add_surface_npz(
+    path: str,
+    name: str | None = None,
+    viewer: Viewer = None,
+):
+    """Add a surface mesh stored as ``vertices`` and ``faces`` arrays in a .npz file."""
+    with np.load(Path(path).expanduser()) as npz:
+        vertices, faces = npz['vertices'], npz['faces']
+    return add_surface(vertices, faces, name=name, viewer=viewer)
+
+def add_vectors_npy(
+    path: str,
+    name: str | None = None,
+    viewer: Viewer = None,
+):
+    """Add a vector field stored in a .npy/.npz file to the viewer."""
+    return add_vectors(_load_array(path), name=name, viewer=viewer)
+
 # ----------------------------------------------------------------------
 # Data Export & Save Functions
 # ----------------------------------------------------------------------
@@ -546,17 +669,65 @@ def save_layers(
     
     return f"Saved {saved_count} layer(s) to {path}"
 
+# layer name -> the .npy file get_layer_data last wrote for it; each file is
+# replaced on the next call for that layer and all are removed on exit
+_LAYER_DATA_FILES: dict = {}
+
+def _remove_layer_data_files():
+    for path in _LAYER_DATA_FILES.values():
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+    _LAYER_DATA_FILES.clear()
+
+atexit.register(_remove_layer_data_files)
+
 def get_layer_data(
     layer_name: str | int,
+    inline: bool = False,
     viewer: Viewer = None,
 ):
-    """Extract layer data as numpy array."""
+    """Extract layer data as numpy array.
+
+    Array data is written to a temporary ``.npy`` file whose path is
+    returned instead of the values, so nothing large goes through JSON.
+    The file replaces the one written by the previous call for the same
+    layer.  With *inline* (for clients on another host, which can't read
+    that file) the array comes back as ``.npz`` bytes holding ``data`` and
+    ``layer_type`` instead.
+    """
+    import tempfile
+
     layer = _get_layer(viewer, layer_name)
     
     if hasattr(layer, 'data'):
         data = layer.data
         if hasattr(data, 'compute'):  # Handle dask arrays
             data = data.compute()
+        if isinstance(data, np.ndarray):
+            if inline:
+                buf = io.BytesIO()
+                np.savez(buf, data=data, layer_type=np.array(layer.__class__.__name__))
+                return buf.getvalue()
+            fd, tmp = tempfile.mkstemp(prefix="napari_layer_", suffix=".npy")
+            with os.fdopen(fd, 'wb') as f:
+                np.save(f, data)
+            previous = _LAYER_DATA_FILES.pop(layer.name, None)
+            _LAYER_DATA_FILES[layer.name] = tmp
+            if previous is not None:
+                # a reader still mapping it keeps its pages (POSIX)
+                try:
+                    os.unlink(previous)
+                except OSError:
+                    pass
+            return {
+                'path': tmp,
+                'shape': data.shape,
+                'dtype': str(data.dtype),
+                'layer_type': layer.__class__.__name__
+            }
+        # e.g. shapes data (a list of differently sized arrays)
         return {
             'data': to_serializable(data),
             'shape': data.shape,
@@ -720,6 +891,37 @@ def set_z_slice(
     
     return f"Z-slice set to {z_index}"
 
+# the running animation's QTimer (kept referenced so it isn't collected)
+_animation_timer = None
+
+def _play_frames(viewer: Viewer, frames, fps: float):
+    """Step the first dimension through *frames* from a QTimer on the GUI thread.
+
+    Returns at once; a new animation replaces one that is still running.
+    """
+    global _animation_timer
+    from qtpy.QtCore import QTimer
+
+    if not fps > 0:
+        raise ValueError(f"fps must be positive, got {fps}")
+    if _animation_timer is not None:
+        _animation_timer.stop()
+    remaining = iter(frames)
+    timer = QTimer()
+    timer.setInterval(max(1, round(1000 / fps)))
+
+    def step():
+        frame = next(remaining, None)
+        if frame is None:
+            timer.stop()
+            return
+        viewer.dims.set_current_step(0, frame)
+
+    timer.timeout.connect(step)
+    step()                                   # show the first frame right away
+    timer.start()
+    _animation_timer = timer
+
 def play_animation(
     start_frame: int,
     end_frame: int,
@@ -730,32 +932,23 @@ def play_animation(
     if start_frame >= viewer.dims.nsteps[0] or end_frame >= viewer.dims.nsteps[0]:
         return f"Frame indices out of bounds (max: {viewer.dims.nsteps[0] - 1})"
     
-    # Set the current frame to start_frame
-    current_step = list(viewer.dims.current_step)
-    current_step[0] = start_frame
-    viewer.dims.current_step = tuple(current_step)
-    
-    # For animation, we need to set the range for the time dimension (first dimension)
-    # Create a new range tuple for the time dimension
-    from napari.utils.misc import RangeTuple
-    
-    # Get current ranges
-    current_ranges = list(viewer.dims.range)
-    
-    # Update the time dimension range (first dimension)
-    current_ranges[0] = RangeTuple(start=float(start_frame), stop=float(end_frame), step=1.0)
-    
-    # Set the new range
-    viewer.dims.range = tuple(current_ranges)
-    
-    # Start animation briefly and then stop it to demonstrate functionality
-    # without causing the function to hang
-    viewer.dims.animation = True
-    
-    # Stop animation immediately to avoid hanging
-    viewer.dims.animation = False
-    
-    return f"Animation range set from frame {start_frame} to {end_frame} at {fps} FPS (animation started and stopped)"
+    # the whole playback runs inside napari; no per-frame round-trips
+    step = 1 if end_frame >= start_frame else -1
+    _play_frames(viewer, range(start_frame, end_frame + step, step), fps)
+    return f"Playing frames {start_frame} to {end_frame} at {fps} FPS"
+
+def set_timesteps(
+    frames: list,
+    fps: float = 10,
+    viewer: Viewer = None,
+):
+    """Show the given time points one after another at *fps*."""
+    nsteps = viewer.dims.nsteps[0]
+    bad = [f for f in frames if not 0 <= f < nsteps]
+    if bad:
+        return f"Frame indices {bad} out of bounds (max: {nsteps - 1})"
+    _play_frames(viewer, [int(f) for f in frames], fps)
+    return f"Playing {len(frames)} frames at {fps} FPS"
 
 # ----------------------------------------------------------------------
 # Enhanced Channel Management Functions
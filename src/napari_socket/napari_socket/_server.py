@@ -1,10 +1,62 @@
 #import json, socketserver, threading
 #from napari._qt.qt_main_window import Window
 # from napari.utils import get_app
-import json, socketserver, threading, queue
+import errno, json, logging, os, socket, socketserver, struct, tempfile, threading, queue
+from typing import Optional
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: replies are encoded with the stdlib
+    orjson = None
+try:
+    import zstandard
+except ImportError:  # optional: replies are never compressed
+    zstandard = None
 from qtpy.QtCore import QObject, Signal, Qt
 from napari._app_model import get_app_model
 
+# every message is prefixed with its byte length (4 bytes, big-endian)
+_FRAME_HEADER = struct.Struct(">I")
+# set in the length prefix of a zstd-compressed reply
+_FRAME_ZSTD = 1 << 31
+# smaller replies aren't worth compressing
+_ZSTD_MIN_SIZE = 4096
+# larger replies are sent after their header instead of being copied onto it
+_SPLIT_WRITE_MIN = 64 * 1024
+# Linux: hold the header back until the body write joins it
+_MSG_MORE = getattr(socket, "MSG_MORE", 0)
+
+def _np_default(obj):
+    """Encode numpy values the JSON codec cannot handle natively."""
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):  # e.g. non-contiguous, or a dtype orjson lacks
+        return obj.tolist()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+if orjson is not None:
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity, as written by a client encoding with the stdlib
+            return json.loads(data)
+
+    # numpy scalars/arrays are encoded in C (NaN becomes null)
+    _ORJSON_OPTS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def _dumps(result) -> bytes:
+        try:
+            return orjson.dumps(result, default=_np_default, option=_ORJSON_OPTS)
+        except TypeError:            # e.g. ints wider than 64 bits: let the stdlib try
+            return json.dumps(result, default=_np_default).encode()
+else:
+    _loads = json.loads
+
+    def _dumps(result) -> bytes:
+        return json.dumps(result, default=_np_default).encode()
+
 # marshal commands to the GUI thread ----------------------------------
 class _Dispatcher(QObject):
     # include a Queue argument that will receive the return-value
@@ -18,15 +70,99 @@ _dispatcher.exec_cmd.connect(
     Qt.QueuedConnection,
 )
 
-class _TCPHandler(socketserver.BaseRequestHandler):
+class _TCPHandler(socketserver.StreamRequestHandler):
     """
     One handler per incoming connection.
-    Expects a single JSON line: ["command.id", [arg1, arg2, ...]]
+    Expects length-prefixed JSON frames: ["command.id", [arg1, arg2, ...]]
+    and answers each with one frame; the connection stays open until the
+    client closes it.
+
+    A command may instead be a header {"cmd", "args", "buffers"} whose
+    "buffers" entries ({"dtype", "shape", "nbytes"}) follow the frame as raw
+    bytes; args (or dict-arg values) of the form {"__buffer__": i} are
+    replaced by those arrays.  A frame that can't be parsed is answered with
+    ERR and the connection closed, since the bytes after it can't be framed.
+
+    A {"hello": {"zstd": true}} frame (sent by remote clients) switches on
+    zstd compression of large replies for the rest of the connection.
     """
+    def setup(self):
+        super().setup()
+        if self.request.family in (socket.AF_INET, socket.AF_INET6):
+            # replies to pipelined commands go out back to back; don't let
+            # Nagle hold one back until the previous reply is ACKed
+            try:
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            except OSError:
+                pass
+
     def handle(self):
-        data = self.request.recv(8192).decode().strip()
+        self._zstd = None
+        self._desynced = False
+        while True:
+            header = self.rfile.read(_FRAME_HEADER.size)
+            if len(header) < _FRAME_HEADER.size:
+                return                       # client closed the connection
+            (size,) = _FRAME_HEADER.unpack(header)
+            data = self.rfile.read(size)
+            if len(data) < size:
+                return
+            reply = self._execute(data)
+            compressed = self._zstd is not None and len(reply) >= _ZSTD_MIN_SIZE
+            if compressed:
+                reply = self._zstd.compress(reply)
+            if len(reply) >= _FRAME_ZSTD:    # the length would spill into the flag bit
+                reply = _err(f"reply too large ({len(reply)} bytes)")
+                compressed = False
+            if compressed:
+                header = _FRAME_HEADER.pack(len(reply) | _FRAME_ZSTD)
+            else:
+                header = _FRAME_HEADER.pack(len(reply))
+            if _MSG_MORE and len(reply) >= _SPLIT_WRITE_MIN:
+                self.request.sendall(header, _MSG_MORE)
+                self.request.sendall(reply)
+            else:
+                self.wfile.write(header + reply)
+            if self._desynced:
+                return
+
+    def _read_buffer(self, desc: dict) -> np.ndarray:
+        """Read one raw array buffer described by *desc* off the stream."""
+        buf = bytearray(desc["nbytes"])
+        view = memoryview(buf)
+        got = 0
+        while got < len(buf):
+            n = self.rfile.readinto(view[got:])
+            if not n:
+                raise ConnectionError("connection closed inside a buffer")
+            got += n
+        return np.frombuffer(buf, dtype=np.dtype(desc["dtype"])).reshape(desc["shape"])
+
+    def _hello(self, options: dict) -> bytes:
+        """Apply per-connection options requested by the client."""
+        if options.get("zstd") and zstandard is not None:
+            self._zstd = zstandard.ZstdCompressor(level=1)
+            return b"OK"
+        return b"ERR zstd compression unavailable"
+
+    def _execute(self, data: bytes) -> bytes:
+        try:
+            msg = _loads(data)
+            # buffers must be consumed even if the command fails later
+            buffers = [self._read_buffer(d) for d in msg.get("buffers", [])] if isinstance(msg, dict) else []
+        except Exception as exc:
+            # unknown how many buffer bytes follow an unreadable header, so
+            # the stream can't be trusted: answer, then drop the connection
+            self._desynced = True
+            return _err(exc)
         try:
-            cmd_id, args = json.loads(data)
+            if isinstance(msg, dict) and "hello" in msg:
+                return self._hello(msg["hello"])
+            if isinstance(msg, dict):
+                cmd_id = msg["cmd"]
+                args = [_restore(a, buffers) for a in msg.get("args") or []]
+            else:
+                cmd_id, args = msg
             print(threading.current_thread())
             # one queue per request
             resp_q: queue.Queue = queue.Queue()
@@ -39,38 +175,121 @@ class _TCPHandler(socketserver.BaseRequestHandler):
                 try:
                     result = result.result(timeout=20)
                 except Exception as e:
-                    self.request.sendall(f"ERR {e}\n".encode())
-                    return
+                    return _err(e)
 
+            if isinstance(result, str):      # plain message: sent as-is, no JSON
+                return b"OKS " + result.encode()
+            if isinstance(result, (bytes, bytearray)):  # binary payload (e.g. an image)
+                return b"OKB " + result
             try:
-                payload = json.dumps(result)
-                reply: bytes = f"OK {payload}\n".encode()
+                reply: bytes = b"OK " + _dumps(result)
             except TypeError:                # result not JSON-serialisable
-                reply = b"OK\n"
+                reply = b"OK"
 
-            self.request.sendall(reply)
+            return reply
         except Exception as exc:
-            self.request.sendall(f"ERR {exc}\n".encode())
+            return _err(exc)
+
+
+def _restore(arg, buffers: list):
+    """Swap ``{"__buffer__": i}`` placeholders in *arg* for the received arrays."""
+    if isinstance(arg, dict):
+        if "__buffer__" in arg:
+            return buffers[arg["__buffer__"]]
+        return {k: _restore(v, buffers) if isinstance(v, dict) else v for k, v in arg.items()}
+    return arg
+
+
+def _err(exc: Exception) -> bytes:
+    """Encode *exc* as an ``ERR`` reply."""
+    return f"ERR {exc}".encode()
+
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _default_unix_path() -> str:
+    """Per-user socket path: in $XDG_RUNTIME_DIR, else uid-suffixed in the temp dir."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, "napari-socket.sock")
+    suffix = f"-{os.getuid()}" if hasattr(os, "getuid") else ""
+    return os.path.join(tempfile.gettempdir(), f"napari-socket{suffix}.sock")
+
+
+# same-host clients can skip the TCP stack by connecting here
+DEFAULT_UNIX_PATH = _default_unix_path()
+
+
+def _bind_unix(path: str) -> socketserver.ThreadingUnixStreamServer:
+    """Listen on *path*, owner-only from the start.
+
+    A socket file left by a crashed session is replaced; one that another
+    live server still answers on is left alone (OSError).
+    """
+    if os.path.lexists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except (ConnectionRefusedError, FileNotFoundError):
+            os.unlink(path)                  # stale socket from an earlier session
+        else:
+            raise OSError(errno.EADDRINUSE, "another napari-socket server is listening", path)
+        finally:
+            probe.close()
+    # created 0600 – no window in which other users could connect
+    old_umask = os.umask(0o177)
+    try:
+        srv = socketserver.ThreadingUnixStreamServer(path, _TCPHandler)
+    finally:
+        os.umask(old_umask)
+    srv.daemon_threads = True
+    return srv
+
 
 class CommandServer(threading.Thread):
     """
-    Runs `socketserver.TCPServer` in its own thread so Qt stays responsive.
+    Runs `socketserver.ThreadingTCPServer` in its own thread so Qt stays
+    responsive; each persistent client connection gets its own thread.
+    With *unix_path* (POSIX only) the same commands are also served on a
+    Unix domain socket.
     """
     #def __init__(self, host="127.0.0.1", port=0):
-    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, unix_path: Optional[str] = None):
         super().__init__(daemon=True)
-        self._srv = socketserver.TCPServer((host, port), _TCPHandler, bind_and_activate=False)
+        self._srv = socketserver.ThreadingTCPServer((host, port), _TCPHandler, bind_and_activate=False)
         self._srv.allow_reuse_address = True
+        self._srv.daemon_threads = True
         self._srv.server_bind()
         self._srv.server_activate()
 
+        self.unix_path = None
+        self._unix_srv = None
+        if unix_path and hasattr(socketserver, "ThreadingUnixStreamServer"):
+            try:
+                self._unix_srv = _bind_unix(unix_path)
+            except OSError as exc:
+                # TCP still serves every client; only the fast path is lost
+                _LOGGER.warning("napari-socket: not listening on %s: %s", unix_path, exc)
+            else:
+                self.unix_path = unix_path
+
     # public -----------------------------------------------------------------
     @property
     def port(self) -> int:
         return self._srv.server_address[1]
 
     def run(self):
+        if self._unix_srv is not None:
+            threading.Thread(target=self._unix_srv.serve_forever, daemon=True).start()
         self._srv.serve_forever()
 
     def shutdown(self):
-        self._srv.shutdown()
\ No newline at end of file
+        self._srv.shutdown()
+        if self._unix_srv is not None:
+            self._unix_srv.shutdown()
+            self._unix_srv.server_close()
+            try:
+                os.unlink(self.unix_path)
+            except OSError:
+                pass
\ No newline at end of file
@@ -1,5 +1,5 @@
 from qtpy.QtWidgets import QWidget, QLabel, QVBoxLayout, QPushButton
-from ._server import CommandServer
+from ._server import CommandServer, DEFAULT_UNIX_PATH
 
 
 class NapariSocketWidget(QWidget):
@@ -27,9 +27,12 @@ class NapariSocketWidget(QWidget):
     # --------------------------------------------------------------------- #
     def _start(self):
         if self._srv is None:
-            self._srv = CommandServer(port = 64908)
+            self._srv = CommandServer(port = 64908, unix_path = DEFAULT_UNIX_PATH)
             self._srv.start()
-            self._lbl.setText(f"Listening on 127.0.0.1:{self._srv.port}")
+            text = f"Listening on 127.0.0.1:{self._srv.port}"
+            if self._srv.unix_path:
+                text += f" and {self._srv.unix_path}"
+            self._lbl.setText(text)
             
     def _stop(self):
         if self._srv: